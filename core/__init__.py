@@ -21,28 +21,38 @@ Author: AI Trading Platform
 __version__ = "2.0.0"
 __author__ = "AI Trading Platform"
 
-# Import core components for easier access
-try:
-    from .unified_config import config
-    from .unified_database import db
-    from .unified_live_data import live_data_manager  
-    from .unified_ai_signals import ai_signal_generator
-    from .unified_trading_manager import trading_manager
-    from .unified_web_dashboard import dashboard_manager
-    from .unified_notifications import notification_manager
-    from .unified_ai_trading_platform import UnifiedTradingPlatform
-    
-    __all__ = [
-        'config',
-        'db', 
-        'live_data_manager',
-        'ai_signal_generator',
-        'trading_manager',
-        'dashboard_manager',
-        'notification_manager',
-        'UnifiedTradingPlatform'
-    ]
-    
-except ImportError as e:
-    # Handle graceful import failures during setup
-    pass
+import importlib
+import sys
+
+# Core components, imported lazily on first attribute access (PEP 562).
+# Each one transitively loads unified_config and unified_database, so this only
+# keeps a bare ``import core`` cheap; it does not shorten platform startup.
+_LAZY_IMPORTS = {
+    'config': 'unified_config',
+    'db': 'unified_database',
+    'live_data_manager': 'unified_live_data',
+    'ai_signal_generator': 'unified_ai_signals',
+    'trading_manager': 'unified_trading_manager',
+    'dashboard_manager': 'unified_web_dashboard',
+    'notification_manager': 'unified_notifications',
+    'UnifiedTradingPlatform': 'unified_ai_trading_platform'
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """Import core components on first access"""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Reuse the bare module the platform already loaded (core/ on sys.path) rather
+    # than importing a second copy of the whole unified_* stack under core.*
+    module_name = _LAZY_IMPORTS[name]
+    module = sys.modules.get(module_name) or importlib.import_module(f'.{module_name}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
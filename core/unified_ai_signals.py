@@ -12,15 +12,30 @@ import logging
 import asyncio
 import json
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import talib, but make it optional
 try:
     import talib
+    from talib import stream as talib_stream
     TALIB_AVAILABLE = True
 except ImportError:
     TALIB_AVAILABLE = False
     print("⚠️  TA-Lib not available - using fallback technical indicators")
 
+# Try to import numba, but make it optional
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -31,60 +46,201 @@ from unified_live_data import live_data_manager, LiveQuote
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Shared pool for the GIL-free indicator groups, used above PARALLEL_MIN_BARS
+PARALLEL_MIN_BARS = 5000
+_INDICATOR_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix='indicators')
+
+def _nan_array(n):
+    """All-NaN float array returned by indicators that lack enough history"""
+    return np.full(n, np.nan)
+
+def _rolling_mean(values, period):
+    """Trailing rolling mean over a strided window view (NaN until the window is full)"""
+    values = np.asarray(values, dtype=np.float64)
+    rolling_mean = _nan_array(len(values))
+    if len(values) >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(values, period)
+        rolling_mean[period - 1:] = windows.mean(axis=1)
+    return rolling_mean
+
+@njit(cache=True, nogil=True)
+def _wilder_average_kernel(deltas, period):
+    """Wilder smoothing of price deltas, seeded with the mean of the first period"""
+    n = deltas.shape[0] + 1
+    averages = np.zeros(n)
+    
+    # First calculation
+    seed = 0.0
+    for i in range(period):
+        seed += deltas[i]
+    averages[period] = seed / period
+    
+    # Subsequent calculations using smoothing
+    for i in range(period + 1, n):
+        averages[i] = (averages[i - 1] * (period - 1) + deltas[i - 1]) / period
+    
+    return averages
+
+@njit(cache=True, nogil=True)
+def _rolling_std_kernel(values, period):
+    """Rolling sample standard deviation (ddof=1) using Welford add/remove updates"""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    
+    for i in range(n):
+        x = values[i]
+        if not np.isnan(x):
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        
+        # Drop the value leaving the window
+        if i >= period:
+            y = values[i - period]
+            if not np.isnan(y):
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = y - mean
+                    mean -= delta / count
+                    m2 -= delta * (y - mean)
+        
+        if count == period:
+            out[i] = np.sqrt(max(m2 / (period - 1), 0.0))
+    
+    return out
+
+@njit(cache=True, nogil=True)
+def _rolling_extreme_kernel(values, period, use_max):
+    """Rolling max/min in O(n) using a monotonic deque of window indices"""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    window = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    last_nan = -1
+    
+    for i in range(n):
+        x = values[i]
+        if np.isnan(x):
+            last_nan = i
+        else:
+            # Pop values the new one dominates
+            if use_max:
+                while tail > head and values[window[tail - 1]] <= x:
+                    tail -= 1
+            else:
+                while tail > head and values[window[tail - 1]] >= x:
+                    tail -= 1
+            window[tail] = i
+            tail += 1
+        
+        # Drop indices that fell out of the window
+        while tail > head and window[head] <= i - period:
+            head += 1
+        
+        if i >= period - 1 and last_nan <= i - period:
+            out[i] = values[window[head]]
+    
+    return out
+
+def _rolling_max(values, period):
+    """Trailing rolling maximum (NaN until the window is full)"""
+    return _rolling_extreme_kernel(np.asarray(values, dtype=np.float64), period, True)
+
+def _rolling_min(values, period):
+    """Trailing rolling minimum (NaN until the window is full)"""
+    return _rolling_extreme_kernel(np.asarray(values, dtype=np.float64), period, False)
+
+@njit(cache=True, nogil=True)
+def _ema_kernel(values, span):
+    """Exponential moving average matching pandas ewm(span=span, adjust=True).mean()"""
+    n = values.shape[0]
+    out = np.empty(n)
+    decay = 1.0 - 2.0 / (span + 1.0)
+    numerator = 0.0
+    denominator = 0.0
+    
+    for i in range(n):
+        x = values[i]
+        numerator *= decay
+        denominator *= decay
+        if not np.isnan(x):
+            numerator += x
+            denominator += 1.0
+        out[i] = numerator / denominator if denominator > 0.0 else np.nan
+    
+    return out
+
+@njit(cache=True, nogil=True)
+def _macd_kernel(ema_fast, ema_slow, signal):
+    """MACD line, signal EMA and histogram in a single pass over the two EMAs"""
+    n = ema_fast.shape[0]
+    macd_line = np.empty(n)
+    signal_line = np.empty(n)
+    histogram = np.empty(n)
+    decay = 1.0 - 2.0 / (signal + 1.0)
+    numerator = 0.0
+    denominator = 0.0
+    
+    for i in range(n):
+        macd = ema_fast[i] - ema_slow[i]
+        numerator *= decay
+        denominator *= decay
+        if not np.isnan(macd):
+            numerator += macd
+            denominator += 1.0
+        macd_line[i] = macd
+        signal_line[i] = numerator / denominator if denominator > 0.0 else np.nan
+        histogram[i] = macd - signal_line[i]
+    
+    return macd_line, signal_line, histogram
+
 # Fallback technical indicators when TA-Lib is not available
 def fallback_rsi(close_prices, period=14):
     """Calculate RSI without TA-Lib"""
     if len(close_prices) < period + 1:
-        return np.array([np.nan] * len(close_prices))
-    
-    deltas = np.diff(close_prices)
-    gains = np.where(deltas > 0, deltas, 0)
-    losses = np.where(deltas < 0, -deltas, 0)
-    
-    avg_gains = np.zeros_like(close_prices, dtype=float)
-    avg_losses = np.zeros_like(close_prices, dtype=float)
+        return _nan_array(len(close_prices))
     
-    # First calculation
-    avg_gains[period] = np.mean(gains[:period])
-    avg_losses[period] = np.mean(losses[:period])
+    deltas = np.diff(np.asarray(close_prices, dtype=np.float64))
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
     
-    # Subsequent calculations using smoothing
-    for i in range(period + 1, len(close_prices)):
-        avg_gains[i] = (avg_gains[i-1] * (period - 1) + gains[i-1]) / period
-        avg_losses[i] = (avg_losses[i-1] * (period - 1) + losses[i-1]) / period
+    avg_gains = _wilder_average_kernel(gains, period)
+    avg_losses = _wilder_average_kernel(losses, period)
     
     rs = avg_gains / (avg_losses + 1e-10)  # Avoid division by zero
     rsi = 100 - (100 / (1 + rs))
     
     return rsi
 
-def fallback_macd(close_prices, fast=12, slow=26, signal=9):
-    """Calculate MACD without TA-Lib"""
+def fallback_macd(close_prices, fast=12, slow=26, signal=9, ema_fast=None, ema_slow=None):
+    """Calculate MACD without TA-Lib (optionally from already computed EMAs)"""
     if len(close_prices) < slow:
-        return np.array([np.nan] * len(close_prices)), np.array([np.nan] * len(close_prices)), np.array([np.nan] * len(close_prices))
+        return _nan_array(len(close_prices)), _nan_array(len(close_prices)), _nan_array(len(close_prices))
     
     # Calculate EMAs
-    ema_fast = pd.Series(close_prices).ewm(span=fast).mean().values
-    ema_slow = pd.Series(close_prices).ewm(span=slow).mean().values
-    
-    # MACD line
-    macd_line = ema_fast - ema_slow
+    if ema_fast is None:
+        ema_fast = fallback_ema(close_prices, fast)
+    if ema_slow is None:
+        ema_slow = fallback_ema(close_prices, slow)
     
-    # Signal line
-    signal_line = pd.Series(macd_line).ewm(span=signal).mean().values
-    
-    # Histogram
-    histogram = macd_line - signal_line
-    
-    return macd_line, signal_line, histogram
+    # MACD line, signal line and histogram
+    return _macd_kernel(ema_fast, ema_slow, signal)
 
 def fallback_bollinger_bands(close_prices, period=20, std_dev=2):
     """Calculate Bollinger Bands without TA-Lib"""
     if len(close_prices) < period:
-        return np.array([np.nan] * len(close_prices)), np.array([np.nan] * len(close_prices)), np.array([np.nan] * len(close_prices))
+        return _nan_array(len(close_prices)), _nan_array(len(close_prices)), _nan_array(len(close_prices))
     
-    rolling_mean = pd.Series(close_prices).rolling(window=period).mean().values
-    rolling_std = pd.Series(close_prices).rolling(window=period).std().values
+    rolling_mean = _rolling_mean(close_prices, period)
+    rolling_std = _rolling_std_kernel(np.asarray(close_prices, dtype=np.float64), period)
     
     upper_band = rolling_mean + (rolling_std * std_dev)
     lower_band = rolling_mean - (rolling_std * std_dev)
@@ -94,49 +250,54 @@ def fallback_bollinger_bands(close_prices, period=20, std_dev=2):
 def fallback_sma(close_prices, period):
     """Calculate Simple Moving Average without TA-Lib"""
     if len(close_prices) < period:
-        return np.array([np.nan] * len(close_prices))
-    return pd.Series(close_prices).rolling(window=period).mean().values
+        return _nan_array(len(close_prices))
+    return _rolling_mean(close_prices, period)
 
 def fallback_ema(close_prices, period):
     """Calculate Exponential Moving Average without TA-Lib"""
-    return pd.Series(close_prices).ewm(span=period).mean().values
+    return _ema_kernel(np.asarray(close_prices, dtype=np.float64), period)
 
 def fallback_adx(high, low, close, period=14):
     """Calculate ADX without TA-Lib (simplified version)"""
     if len(close) < period + 1:
-        return np.array([np.nan] * len(close))
+        return _nan_array(len(close))
     
     # Simplified ADX calculation - returns trend strength approximation
     price_range = high - low
-    avg_range = pd.Series(price_range).rolling(window=period).mean().values
+    avg_range = _rolling_mean(price_range, period)
     price_change = np.abs(np.diff(close, prepend=close[0]))
-    avg_change = pd.Series(price_change).rolling(window=period).mean().values
+    avg_change = _rolling_mean(price_change, period)
     
     # Simple trend strength indicator (0-100)
     trend_strength = np.minimum(100, (avg_change / (avg_range + 1e-10)) * 50)
     
     return trend_strength
 
-def fallback_stochastic(high, low, close, k_period=14, d_period=3):
-    """Calculate Stochastic without TA-Lib"""
+def fallback_stochastic(high, low, close, k_period=14, d_period=3,
+                        lowest_low=None, highest_high=None):
+    """Calculate Stochastic without TA-Lib (optionally from an already computed high/low window)"""
     if len(close) < k_period:
-        return np.array([np.nan] * len(close)), np.array([np.nan] * len(close))
+        return _nan_array(len(close)), _nan_array(len(close))
     
-    lowest_low = pd.Series(low).rolling(window=k_period).min().values
-    highest_high = pd.Series(high).rolling(window=k_period).max().values
+    if lowest_low is None:
+        lowest_low = _rolling_min(low, k_period)
+    if highest_high is None:
+        highest_high = _rolling_max(high, k_period)
     
     k_percent = 100 * ((close - lowest_low) / (highest_high - lowest_low + 1e-10))
-    d_percent = pd.Series(k_percent).rolling(window=d_period).mean().values
+    d_percent = _rolling_mean(k_percent, d_period)
     
     return k_percent, d_percent
 
-def fallback_williams_r(high, low, close, period=14):
-    """Calculate Williams %R without TA-Lib"""
+def fallback_williams_r(high, low, close, period=14, lowest_low=None, highest_high=None):
+    """Calculate Williams %R without TA-Lib (optionally from an already computed high/low window)"""
     if len(close) < period:
-        return np.array([np.nan] * len(close))
+        return _nan_array(len(close))
     
-    highest_high = pd.Series(high).rolling(window=period).max().values
-    lowest_low = pd.Series(low).rolling(window=period).min().values
+    if highest_high is None:
+        highest_high = _rolling_max(high, period)
+    if lowest_low is None:
+        lowest_low = _rolling_min(low, period)
     
     williams_r = -100 * ((highest_high - close) / (highest_high - lowest_low + 1e-10))
     
@@ -145,11 +306,19 @@ def fallback_williams_r(high, low, close, period=14):
 def fallback_cci(high, low, close, period=20):
     """Calculate CCI without TA-Lib"""
     if len(close) < period:
-        return np.array([np.nan] * len(close))
+        return _nan_array(len(close))
     
     typical_price = (high + low + close) / 3
-    sma_tp = pd.Series(typical_price).rolling(window=period).mean().values
-    mad = pd.Series(typical_price).rolling(window=period).apply(lambda x: np.mean(np.abs(x - np.mean(x)))).values
+    
+    # Rolling mean and mean absolute deviation over a strided window view
+    # (one vectorized pass instead of a Python lambda per window)
+    windows = np.lib.stride_tricks.sliding_window_view(typical_price, period)
+    window_mean = windows.mean(axis=1)
+    
+    sma_tp = np.full(len(typical_price), np.nan)
+    mad = np.full(len(typical_price), np.nan)
+    sma_tp[period - 1:] = window_mean
+    mad[period - 1:] = np.abs(windows - window_mean[:, None]).mean(axis=1)
     
     cci = (typical_price - sma_tp) / (0.015 * mad + 1e-10)
     
@@ -158,7 +327,7 @@ def fallback_cci(high, low, close, period=20):
 def fallback_momentum(close_prices, period=10):
     """Calculate Momentum without TA-Lib"""
     if len(close_prices) < period:
-        return np.array([np.nan] * len(close_prices))
+        return _nan_array(len(close_prices))
     
     momentum = np.zeros_like(close_prices, dtype=float)
     momentum[:period] = np.nan
@@ -166,6 +335,9 @@ def fallback_momentum(close_prices, period=10):
     
     return momentum
 
+# Vote direction of each strategy signal when combining strategies
+SIGNAL_DIRECTIONS = {'BUY': 1, 'SELL': -1, 'HOLD': 0}
+
 @dataclass
 class TechnicalIndicators:
     """Technical indicators for a symbol"""
@@ -211,112 +383,209 @@ class TechnicalAnalyzer:
     
     def __init__(self):
         self.indicators_cache = {}
+        # Pick the indicator backend once instead of branching on every call
+        self._backend = self._calculate_with_talib if TALIB_AVAILABLE else self._calculate_with_fallback
         logger.info("Technical analyzer initialized")
     
-    def calculate_indicators(self, data: pd.DataFrame) -> Optional[TechnicalIndicators]:
-        """Calculate all technical indicators"""
+    def _calculate_with_talib(self, close: np.ndarray, high: np.ndarray,
+                              low: np.ndarray, volume: np.ndarray) -> Dict[str, float]:
+        """Latest indicator values using TA-Lib"""
+        # Recursive indicators (RSI, MACD, EMA, ADX) depend on the whole history,
+        # so they run over the full arrays; fixed-window ones only need the last
+        # value and use the streaming API
+        rsi = talib.RSI(close, timeperiod=config.RSI_PERIOD)[-1]
+        
+        macd, macd_signal, macd_hist = talib.MACD(close, 
+                                                 fastperiod=config.MACD_FAST,
+                                                 slowperiod=config.MACD_SLOW,
+                                                 signalperiod=config.MACD_SIGNAL)
+        
+        bb_upper, bb_middle, bb_lower = talib_stream.BBANDS(close, 
+                                                           timeperiod=config.BB_PERIOD,
+                                                           nbdevup=config.BB_STD,
+                                                           nbdevdn=config.BB_STD)
+        
+        sma_20 = talib_stream.SMA(close, timeperiod=config.SMA_SHORT)
+        sma_50 = talib_stream.SMA(close, timeperiod=config.SMA_LONG)
+        ema_12 = talib.EMA(close, timeperiod=config.EMA_SHORT)[-1]
+        ema_26 = talib.EMA(close, timeperiod=config.EMA_LONG)[-1]
+        
+        volume_sma = talib_stream.SMA(volume, timeperiod=20)
+        adx = talib.ADX(high, low, close, timeperiod=14)[-1]
+        
+        stoch_k, stoch_d = talib_stream.STOCH(high, low, close)
+        williams_r = talib_stream.WILLR(high, low, close)
+        cci = talib_stream.CCI(high, low, close)
+        momentum = talib_stream.MOM(close, timeperiod=10)
+        
+        return {
+            'rsi': rsi,
+            'macd': macd[-1],
+            'macd_signal': macd_signal[-1],
+            'macd_histogram': macd_hist[-1],
+            'bb_upper': bb_upper,
+            'bb_middle': bb_middle,
+            'bb_lower': bb_lower,
+            'sma_20': sma_20,
+            'sma_50': sma_50,
+            'ema_12': ema_12,
+            'ema_26': ema_26,
+            'volume_sma': volume_sma,
+            'adx': adx,
+            'stoch_k': stoch_k,
+            'stoch_d': stoch_d,
+            'williams_r': williams_r,
+            'cci': cci,
+            'momentum': momentum
+        }
+    
+    def _momentum_values(self, close: np.ndarray) -> Dict[str, float]:
+        """RSI, EMA, MACD and momentum from the close series"""
+        rsi_array = fallback_rsi(close, config.RSI_PERIOD)
+        rsi = rsi_array[-1] if not np.isnan(rsi_array[-1]) else 50
+        
+        ema_12_array = fallback_ema(close, config.EMA_SHORT)
+        ema_12 = ema_12_array[-1] if not np.isnan(ema_12_array[-1]) else close[-1]
+        
+        ema_26_array = fallback_ema(close, config.EMA_LONG)
+        ema_26 = ema_26_array[-1] if not np.isnan(ema_26_array[-1]) else close[-1]
+        
+        # Reuse the EMA passes above when MACD runs on the same periods
+        ema_arrays = {config.EMA_SHORT: ema_12_array, config.EMA_LONG: ema_26_array}
+        macd, macd_signal, macd_hist = fallback_macd(close, 
+                                                    config.MACD_FAST,
+                                                    config.MACD_SLOW,
+                                                    config.MACD_SIGNAL,
+                                                    ema_fast=ema_arrays.get(config.MACD_FAST),
+                                                    ema_slow=ema_arrays.get(config.MACD_SLOW))
+        
+        momentum_array = fallback_momentum(close, 10)
+        momentum = momentum_array[-1] if not np.isnan(momentum_array[-1]) else 0
+        
+        return {
+            'rsi': rsi,
+            'macd': macd[-1],
+            'macd_signal': macd_signal[-1],
+            'macd_histogram': macd_hist[-1],
+            'ema_12': ema_12,
+            'ema_26': ema_26,
+            'momentum': momentum
+        }
+    
+    def _price_action_values(self, close: np.ndarray, high: np.ndarray,
+                             low: np.ndarray) -> Dict[str, float]:
+        """Bands, moving averages, ADX and range oscillators"""
+        bb_upper, bb_middle, bb_lower = fallback_bollinger_bands(close, 
+                                                                config.BB_PERIOD,
+                                                                config.BB_STD)
+        
+        # The Bollinger middle band already is the SMA over BB_PERIOD
+        if config.SMA_SHORT == config.BB_PERIOD:
+            sma_20_array = bb_middle
+        else:
+            sma_20_array = fallback_sma(close, config.SMA_SHORT)
+        sma_20 = sma_20_array[-1] if not np.isnan(sma_20_array[-1]) else close[-1]
+        
+        sma_50_array = fallback_sma(close, config.SMA_LONG)
+        sma_50 = sma_50_array[-1] if not np.isnan(sma_50_array[-1]) else close[-1]
+        
+        adx_array = fallback_adx(high, low, close, 14)
+        adx = adx_array[-1] if not np.isnan(adx_array[-1]) else 25
+        
+        # Stochastic and Williams %R share the same 14-bar high/low window
+        lowest_low_14 = _rolling_min(low, 14)
+        highest_high_14 = _rolling_max(high, 14)
+        stoch_k, stoch_d = fallback_stochastic(high, low, close,
+                                               lowest_low=lowest_low_14,
+                                               highest_high=highest_high_14)
+        williams_r_array = fallback_williams_r(high, low, close,
+                                               lowest_low=lowest_low_14,
+                                               highest_high=highest_high_14)
+        williams_r = williams_r_array[-1] if not np.isnan(williams_r_array[-1]) else -50
+        
+        cci_array = fallback_cci(high, low, close)
+        cci = cci_array[-1] if not np.isnan(cci_array[-1]) else 0
+        
+        return {
+            'bb_upper': bb_upper[-1],
+            'bb_middle': bb_middle[-1],
+            'bb_lower': bb_lower[-1],
+            'sma_20': sma_20,
+            'sma_50': sma_50,
+            'adx': adx,
+            'stoch_k': stoch_k[-1],
+            'stoch_d': stoch_d[-1],
+            'williams_r': williams_r,
+            'cci': cci
+        }
+    
+    def _volume_values(self, volume: np.ndarray) -> Dict[str, float]:
+        """Volume moving average"""
+        volume_sma_array = fallback_sma(volume, 20)
+        volume_sma = volume_sma_array[-1] if not np.isnan(volume_sma_array[-1]) else volume[-1]
+        return {'volume_sma': volume_sma}
+    
+    def _calculate_with_fallback(self, close: np.ndarray, high: np.ndarray,
+                                 low: np.ndarray, volume: np.ndarray) -> Dict[str, float]:
+        """Latest indicator values using the fallback implementations"""
+        groups = ((self._momentum_values, (close,)),
+                  (self._price_action_values, (close, high, low)),
+                  (self._volume_values, (volume,)))
+        
+        # The nogil kernels let the three independent groups run in parallel,
+        # but only long series amortize the pool hand-off
+        if NUMBA_AVAILABLE and len(close) >= PARALLEL_MIN_BARS:
+            futures = [_INDICATOR_EXECUTOR.submit(func, *args) for func, args in groups]
+            parts = [future.result() for future in futures]
+        else:
+            parts = [func(*args) for func, args in groups]
+        
+        values = {}
+        for part in parts:
+            values.update(part)
+        return values
+    
+    def calculate_indicators(self, data: pd.DataFrame,
+                             symbol: str = None) -> Optional[TechnicalIndicators]:
+        """Calculate all technical indicators (cached per symbol until a new bar arrives)"""
         try:
             if data.empty or len(data) < 50:
                 return None
             
-            close = data['Close'].values
-            high = data['High'].values
-            low = data['Low'].values
-            volume = data['Volume'].values
-            
-            if TALIB_AVAILABLE:
-                # Use TA-Lib functions
-                rsi = talib.RSI(close, timeperiod=config.RSI_PERIOD)[-1]
-                
-                macd, macd_signal, macd_hist = talib.MACD(close, 
-                                                         fastperiod=config.MACD_FAST,
-                                                         slowperiod=config.MACD_SLOW,
-                                                         signalperiod=config.MACD_SIGNAL)
-                
-                bb_upper, bb_middle, bb_lower = talib.BBANDS(close, 
-                                                            timeperiod=config.BB_PERIOD,
-                                                            nbdevup=config.BB_STD,
-                                                            nbdevdn=config.BB_STD)
-                
-                sma_20 = talib.SMA(close, timeperiod=config.SMA_SHORT)[-1]
-                sma_50 = talib.SMA(close, timeperiod=config.SMA_LONG)[-1]
-                ema_12 = talib.EMA(close, timeperiod=config.EMA_SHORT)[-1]
-                ema_26 = talib.EMA(close, timeperiod=config.EMA_LONG)[-1]
-                
-                volume_sma = talib.SMA(volume.astype(float), timeperiod=20)[-1]
-                adx = talib.ADX(high, low, close, timeperiod=14)[-1]
-                
-                stoch_k, stoch_d = talib.STOCH(high, low, close)
-                williams_r = talib.WILLR(high, low, close)[-1]
-                cci = talib.CCI(high, low, close)[-1]
-                momentum = talib.MOM(close, timeperiod=10)[-1]
-                
-            else:
-                # Use fallback functions
-                rsi_array = fallback_rsi(close, config.RSI_PERIOD)
-                rsi = rsi_array[-1] if not np.isnan(rsi_array[-1]) else 50
-                
-                macd, macd_signal, macd_hist = fallback_macd(close, 
-                                                            config.MACD_FAST,
-                                                            config.MACD_SLOW,
-                                                            config.MACD_SIGNAL)
-                
-                bb_upper, bb_middle, bb_lower = fallback_bollinger_bands(close, 
-                                                                        config.BB_PERIOD,
-                                                                        config.BB_STD)
-                
-                sma_20_array = fallback_sma(close, config.SMA_SHORT)
-                sma_20 = sma_20_array[-1] if not np.isnan(sma_20_array[-1]) else close[-1]
-                
-                sma_50_array = fallback_sma(close, config.SMA_LONG)
-                sma_50 = sma_50_array[-1] if not np.isnan(sma_50_array[-1]) else close[-1]
-                
-                ema_12_array = fallback_ema(close, config.EMA_SHORT)
-                ema_12 = ema_12_array[-1] if not np.isnan(ema_12_array[-1]) else close[-1]
-                
-                ema_26_array = fallback_ema(close, config.EMA_LONG)
-                ema_26 = ema_26_array[-1] if not np.isnan(ema_26_array[-1]) else close[-1]
-                
-                volume_sma_array = fallback_sma(volume.astype(float), 20)
-                volume_sma = volume_sma_array[-1] if not np.isnan(volume_sma_array[-1]) else volume[-1]
-                
-                adx_array = fallback_adx(high, low, close, 14)
-                adx = adx_array[-1] if not np.isnan(adx_array[-1]) else 25
-                
-                stoch_k, stoch_d = fallback_stochastic(high, low, close)
-                williams_r_array = fallback_williams_r(high, low, close)
-                williams_r = williams_r_array[-1] if not np.isnan(williams_r_array[-1]) else -50
-                
-                cci_array = fallback_cci(high, low, close)
-                cci = cci_array[-1] if not np.isnan(cci_array[-1]) else 0
-                
-                momentum_array = fallback_momentum(close, 10)
-                momentum = momentum_array[-1] if not np.isnan(momentum_array[-1]) else 0
-            
-            return TechnicalIndicators(
-                rsi=float(rsi),
-                macd=float(macd[-1]),
-                macd_signal=float(macd_signal[-1]),
-                macd_histogram=float(macd_hist[-1]),
-                bb_upper=float(bb_upper[-1]),
-                bb_middle=float(bb_middle[-1]),
-                bb_lower=float(bb_lower[-1]),
-                sma_20=float(sma_20),
-                sma_50=float(sma_50),
-                ema_12=float(ema_12),
-                ema_26=float(ema_26),
-                volume_sma=float(volume_sma),
-                adx=float(adx),
-                stoch_k=float(stoch_k[-1]),
-                stoch_d=float(stoch_d[-1]),
-                williams_r=float(williams_r),
-                cci=float(cci),
-                momentum=float(momentum)
-            )
+            # Contiguous float64 inputs once: TA-Lib and the JIT kernels both require
+            # double arrays, so nothing below has to copy or cast again
+            close = np.ascontiguousarray(data['Close'].values, dtype=np.float64)
+            high = np.ascontiguousarray(data['High'].values, dtype=np.float64)
+            low = np.ascontiguousarray(data['Low'].values, dtype=np.float64)
+            volume = np.ascontiguousarray(data['Volume'].values, dtype=np.float64)
+            
+            # Reuse the previous result while the latest bar is unchanged
+            bar_key = (len(data), data.index[-1], close[-1], high[-1], low[-1], volume[-1])
+            if symbol is not None:
+                cached = self.indicators_cache.get(symbol)
+                if cached is not None and cached[0] == bar_key:
+                    return cached[1]
+            
+            values = self._backend(close, high, low, volume)
+            indicators = TechnicalIndicators(**{name: float(value) for name, value in values.items()})
+            
+            if symbol is not None:
+                self.indicators_cache[symbol] = (bar_key, indicators)
+            
+            return indicators
             
         except Exception as e:
             logger.error(f"Error calculating indicators: {e}")
             return None
+    
+    def warm_up(self):
+        """Compile the JIT indicator kernels before the first live signal run"""
+        if TALIB_AVAILABLE or not NUMBA_AVAILABLE:
+            return
+        
+        close = np.linspace(100.0, 110.0, 64)
+        self._calculate_with_fallback(close, close + 1.0, close - 1.0, np.full(64, 1000.0))
+        logger.info("Indicator kernels compiled")
 
 class AISignalGenerator:
     """Advanced AI signal generator with multiple strategies"""
@@ -343,16 +612,17 @@ class AISignalGenerator:
         """Trend following strategy"""
         signals = []
         reasons = []
+        sma_20 = indicators.sma_20
         
         # Moving average signals
-        if indicators.sma_20 > indicators.sma_50:
-            if current_price > indicators.sma_20:
+        if sma_20 > indicators.sma_50:
+            if current_price > sma_20:
                 signals.append('BUY')
-                reasons.append(f"Price above upward trending SMA20 ({indicators.sma_20:.2f})")
+                reasons.append(f"Price above upward trending SMA20 ({sma_20:.2f})")
         else:
-            if current_price < indicators.sma_20:
+            if current_price < sma_20:
                 signals.append('SELL')
-                reasons.append(f"Price below downward trending SMA20 ({indicators.sma_20:.2f})")
+                reasons.append(f"Price below downward trending SMA20 ({sma_20:.2f})")
         
         # EMA crossover
         if indicators.ema_12 > indicators.ema_26:
@@ -363,9 +633,9 @@ class AISignalGenerator:
             reasons.append("EMA12 below EMA26 (bearish trend)")
         
         # ADX trend strength
-        if indicators.adx > 25:
-            if len(signals) > 0:
-                reasons.append(f"Strong trend confirmed by ADX ({indicators.adx:.1f})")
+        adx = indicators.adx
+        if adx > 25 and signals:
+            reasons.append(f"Strong trend confirmed by ADX ({adx:.1f})")
         
         # Determine signal
         buy_count = signals.count('BUY')
@@ -385,38 +655,45 @@ class AISignalGenerator:
         """Mean reversion strategy"""
         signals = []
         reasons = []
+        rsi = indicators.rsi
+        rsi_oversold = config.RSI_OVERSOLD
+        rsi_overbought = config.RSI_OVERBOUGHT
+        bb_lower = indicators.bb_lower
+        bb_upper = indicators.bb_upper
+        williams_r = indicators.williams_r
+        cci = indicators.cci
         
         # RSI oversold/overbought
-        if indicators.rsi < config.RSI_OVERSOLD:
+        if rsi < rsi_oversold:
             signals.append('BUY')
-            reasons.append(f"RSI oversold ({indicators.rsi:.1f} < {config.RSI_OVERSOLD})")
-        elif indicators.rsi > config.RSI_OVERBOUGHT:
+            reasons.append(f"RSI oversold ({rsi:.1f} < {rsi_oversold})")
+        elif rsi > rsi_overbought:
             signals.append('SELL')
-            reasons.append(f"RSI overbought ({indicators.rsi:.1f} > {config.RSI_OVERBOUGHT})")
+            reasons.append(f"RSI overbought ({rsi:.1f} > {rsi_overbought})")
         
         # Bollinger Bands
-        if current_price <= indicators.bb_lower:
+        if current_price <= bb_lower:
             signals.append('BUY')
-            reasons.append(f"Price at lower Bollinger Band ({indicators.bb_lower:.2f})")
-        elif current_price >= indicators.bb_upper:
+            reasons.append(f"Price at lower Bollinger Band ({bb_lower:.2f})")
+        elif current_price >= bb_upper:
             signals.append('SELL')
-            reasons.append(f"Price at upper Bollinger Band ({indicators.bb_upper:.2f})")
+            reasons.append(f"Price at upper Bollinger Band ({bb_upper:.2f})")
         
         # Williams %R
-        if indicators.williams_r < -80:
+        if williams_r < -80:
             signals.append('BUY')
-            reasons.append(f"Williams %R oversold ({indicators.williams_r:.1f})")
-        elif indicators.williams_r > -20:
+            reasons.append(f"Williams %R oversold ({williams_r:.1f})")
+        elif williams_r > -20:
             signals.append('SELL')
-            reasons.append(f"Williams %R overbought ({indicators.williams_r:.1f})")
+            reasons.append(f"Williams %R overbought ({williams_r:.1f})")
         
         # CCI
-        if indicators.cci < -100:
+        if cci < -100:
             signals.append('BUY')
-            reasons.append(f"CCI oversold ({indicators.cci:.1f})")
-        elif indicators.cci > 100:
+            reasons.append(f"CCI oversold ({cci:.1f})")
+        elif cci > 100:
             signals.append('SELL')
-            reasons.append(f"CCI overbought ({indicators.cci:.1f})")
+            reasons.append(f"CCI overbought ({cci:.1f})")
         
         # Determine signal
         buy_count = signals.count('BUY')
@@ -436,38 +713,45 @@ class AISignalGenerator:
         """Momentum-based strategy"""
         signals = []
         reasons = []
+        macd = indicators.macd
+        macd_signal = indicators.macd_signal
+        macd_histogram = indicators.macd_histogram
+        stoch_k = indicators.stoch_k
+        stoch_d = indicators.stoch_d
+        momentum = indicators.momentum
+        change_percent = quote.change_percent
         
         # MACD
-        if indicators.macd > indicators.macd_signal and indicators.macd_histogram > 0:
+        if macd > macd_signal and macd_histogram > 0:
             signals.append('BUY')
             reasons.append("MACD bullish (above signal line with positive histogram)")
-        elif indicators.macd < indicators.macd_signal and indicators.macd_histogram < 0:
+        elif macd < macd_signal and macd_histogram < 0:
             signals.append('SELL')
             reasons.append("MACD bearish (below signal line with negative histogram)")
         
         # Stochastic
-        if indicators.stoch_k > indicators.stoch_d and indicators.stoch_k < 80:
+        if stoch_k > stoch_d and stoch_k < 80:
             signals.append('BUY')
-            reasons.append(f"Stochastic bullish crossover (K={indicators.stoch_k:.1f})")
-        elif indicators.stoch_k < indicators.stoch_d and indicators.stoch_k > 20:
+            reasons.append(f"Stochastic bullish crossover (K={stoch_k:.1f})")
+        elif stoch_k < stoch_d and stoch_k > 20:
             signals.append('SELL')
-            reasons.append(f"Stochastic bearish crossover (K={indicators.stoch_k:.1f})")
+            reasons.append(f"Stochastic bearish crossover (K={stoch_k:.1f})")
         
         # Price momentum
-        if indicators.momentum > 0:
+        if momentum > 0:
             signals.append('BUY')
-            reasons.append(f"Positive price momentum ({indicators.momentum:.2f})")
-        elif indicators.momentum < 0:
+            reasons.append(f"Positive price momentum ({momentum:.2f})")
+        elif momentum < 0:
             signals.append('SELL')
-            reasons.append(f"Negative price momentum ({indicators.momentum:.2f})")
+            reasons.append(f"Negative price momentum ({momentum:.2f})")
         
         # Intraday momentum
-        if quote.change_percent > 2:
+        if change_percent > 2:
             signals.append('BUY')
-            reasons.append(f"Strong intraday momentum (+{quote.change_percent:.1f}%)")
-        elif quote.change_percent < -2:
+            reasons.append(f"Strong intraday momentum (+{change_percent:.1f}%)")
+        elif change_percent < -2:
             signals.append('SELL')
-            reasons.append(f"Strong intraday decline ({quote.change_percent:.1f}%)")
+            reasons.append(f"Strong intraday decline ({change_percent:.1f}%)")
         
         # Determine signal
         buy_count = signals.count('BUY')
@@ -490,8 +774,8 @@ class AISignalGenerator:
         
         try:
             # 20-day high/low breakouts
-            high_20 = data['High'].tail(20).max()
-            low_20 = data['Low'].tail(20).min()
+            high_20 = np.nanmax(data['High'].values[-20:])
+            low_20 = np.nanmin(data['Low'].values[-20:])
             
             if current_price > high_20 * 1.001:  # 0.1% above 20-day high
                 signals.append('BUY')
@@ -501,20 +785,22 @@ class AISignalGenerator:
                 reasons.append(f"Breakdown below 20-day low ({low_20:.2f})")
             
             # Bollinger Band breakouts
-            bb_width = (indicators.bb_upper - indicators.bb_lower) / indicators.bb_middle
+            bb_upper = indicators.bb_upper
+            bb_lower = indicators.bb_lower
+            bb_middle = indicators.bb_middle
+            bb_width = (bb_upper - bb_lower) / bb_middle if bb_middle > 0 else float('inf')
             if bb_width < 0.02:  # Narrow bands indicate potential breakout
-                if current_price > indicators.bb_upper:
+                if current_price > bb_upper:
                     signals.append('BUY')
                     reasons.append("Bullish breakout from tight Bollinger Bands")
-                elif current_price < indicators.bb_lower:
+                elif current_price < bb_lower:
                     signals.append('SELL')
                     reasons.append("Bearish breakdown from tight Bollinger Bands")
             
             # Volume confirmation
-            recent_volume = data['Volume'].tail(5).mean()
-            if recent_volume > indicators.volume_sma * 1.5:
-                if len(signals) > 0:
-                    reasons.append("High volume confirms breakout")
+            recent_volume = np.nanmean(data['Volume'].values[-5:])
+            if recent_volume > indicators.volume_sma * 1.5 and signals:
+                reasons.append("High volume confirms breakout")
             
         except Exception as e:
             logger.error(f"Error in breakout strategy: {e}")
@@ -539,37 +825,37 @@ class AISignalGenerator:
         reasons = []
         
         try:
+            volume = quote.volume
+            volume_sma = indicators.volume_sma
+            price_change = quote.change_percent
+            
             # Volume trend analysis
-            if quote.volume > indicators.volume_sma * 2:
-                if quote.change_percent > 0:
+            if volume > volume_sma * 2:
+                if price_change > 0:
                     signals.append('BUY')
-                    reasons.append(f"High volume bullish ({quote.volume:,} vs avg {indicators.volume_sma:,.0f})")
+                    reasons.append(f"High volume bullish ({volume:,} vs avg {volume_sma:,.0f})")
                 else:
                     signals.append('SELL')
-                    reasons.append(f"High volume bearish ({quote.volume:,} vs avg {indicators.volume_sma:,.0f})")
-            
-            # On-Balance Volume (OBV) simulation
-            obv_data = []
-            obv = 0
-            for i, row in data.tail(20).iterrows():
-                if row['Close'] > row['Open']:
-                    obv += row['Volume']
-                elif row['Close'] < row['Open']:
-                    obv -= row['Volume']
-                obv_data.append(obv)
+                    reasons.append(f"High volume bearish ({volume:,} vs avg {volume_sma:,.0f})")
+            
+            # On-Balance Volume (OBV) simulation as one cumulative sum over the last 20 bars
+            recent = data.tail(20)
+            close = recent['Close'].values
+            open_ = recent['Open'].values
+            direction = np.where(close > open_, 1.0, np.where(close < open_, -1.0, 0.0))
+            obv_data = np.cumsum(direction * recent['Volume'].values)
             
             if len(obv_data) >= 2:
                 obv_trend = obv_data[-1] - obv_data[-5] if len(obv_data) >= 5 else obv_data[-1] - obv_data[-2]
-                if obv_trend > 0 and quote.change_percent > 0:
+                if obv_trend > 0 and price_change > 0:
                     signals.append('BUY')
                     reasons.append("Positive volume accumulation trend")
-                elif obv_trend < 0 and quote.change_percent < 0:
+                elif obv_trend < 0 and price_change < 0:
                     signals.append('SELL')
                     reasons.append("Negative volume distribution trend")
             
             # Price-volume divergence
-            price_change = quote.change_percent
-            volume_ratio = quote.volume / indicators.volume_sma
+            volume_ratio = volume / volume_sma if volume_sma > 0 else 1
             
             if price_change > 1 and volume_ratio < 0.8:
                 reasons.append("Caution: Price rise on low volume")
@@ -597,7 +883,7 @@ class AISignalGenerator:
         """Generate comprehensive AI signal"""
         try:
             # Calculate technical indicators
-            indicators = self.technical_analyzer.calculate_indicators(historical_data)
+            indicators = self.technical_analyzer.calculate_indicators(historical_data, symbol)
             if not indicators:
                 return AISignal(
                     symbol=symbol,
@@ -641,18 +927,11 @@ class AISignalGenerator:
             strategy_results['volume_analysis'] = (vol_signal, vol_conf)
             all_reasons.extend([f"Volume: {r}" for r in vol_reasons])
             
-            # Combine signals using weighted approach
-            weighted_score = 0
-            total_weight = 0
-            
-            for strategy, (signal, confidence) in strategy_results.items():
-                weight = self.strategy_weights[strategy]
-                if signal == 'BUY':
-                    weighted_score += confidence * weight
-                elif signal == 'SELL':
-                    weighted_score -= confidence * weight
-                # HOLD contributes 0
-                total_weight += weight
+            # Combine signals as a weighted sum of directional votes (HOLD contributes 0)
+            weights = self.strategy_weights
+            weighted_score = sum(SIGNAL_DIRECTIONS[signal] * confidence * weights[strategy]
+                                 for strategy, (signal, confidence) in strategy_results.items())
+            total_weight = sum(weights[strategy] for strategy in strategy_results)
             
             # Normalize score
             final_score = weighted_score / total_weight if total_weight > 0 else 0
@@ -725,50 +1004,56 @@ class AISignalGenerator:
                 technical_data={}
             )
     
+    async def _generate_signal_for_symbol(self, symbol: str) -> Optional[AISignal]:
+        """Fetch data, generate and store the signal for one watchlist symbol"""
+        try:
+            # Get live quote
+            quote = await live_data_manager.get_live_quote(symbol)
+            if not quote:
+                logger.warning(f"No live quote available for {symbol}")
+                return None
+            
+            # Get historical data (blocking download, keep it off the event loop)
+            historical_data = await asyncio.to_thread(
+                live_data_manager.get_historical_data, symbol, "6mo")
+            if historical_data.empty:
+                logger.warning(f"No historical data available for {symbol}")
+                return None
+            
+            # Generate signal
+            signal = await asyncio.to_thread(self.generate_signal, symbol, quote, historical_data)
+            
+            # Store in database
+            signal_record = SignalRecord(
+                symbol=signal.symbol,
+                signal_type=signal.signal_type,
+                confidence=signal.confidence,
+                reasoning=signal.reasoning,
+                technical_data=signal.technical_data,
+                timestamp=signal.timestamp
+            )
+            
+            self.db.store_signal(signal_record)
+            
+            logger.debug(f"Generated {signal.signal_type} signal for {symbol} "
+                       f"with {signal.confidence:.1f}% confidence")
+            
+            return signal
+            
+        except Exception as e:
+            logger.error(f"Error generating signal for {symbol}: {e}")
+            return None
+    
     async def generate_signals_for_watchlist(self) -> List[AISignal]:
         """Generate signals for all watchlist symbols"""
-        signals = []
-        
         try:
             watchlist = config.get_active_symbols()
             logger.info(f"Generating signals for {len(watchlist)} symbols")
             
-            for symbol in watchlist:
-                try:
-                    # Get live quote
-                    quote = await live_data_manager.get_live_quote(symbol)
-                    if not quote:
-                        logger.warning(f"No live quote available for {symbol}")
-                        continue
-                    
-                    # Get historical data
-                    historical_data = live_data_manager.get_historical_data(symbol, period="6mo")
-                    if historical_data.empty:
-                        logger.warning(f"No historical data available for {symbol}")
-                        continue
-                    
-                    # Generate signal
-                    signal = self.generate_signal(symbol, quote, historical_data)
-                    signals.append(signal)
-                    
-                    # Store in database
-                    signal_record = SignalRecord(
-                        symbol=signal.symbol,
-                        signal_type=signal.signal_type,
-                        confidence=signal.confidence,
-                        reasoning=signal.reasoning,
-                        technical_data=signal.technical_data,
-                        timestamp=signal.timestamp
-                    )
-                    
-                    self.db.store_signal(signal_record)
-                    
-                    logger.debug(f"Generated {signal.signal_type} signal for {symbol} "
-                               f"with {signal.confidence:.1f}% confidence")
-                    
-                except Exception as e:
-                    logger.error(f"Error generating signal for {symbol}: {e}")
-                    continue
+            # Symbols are independent, so process them concurrently
+            results = await asyncio.gather(
+                *(self._generate_signal_for_symbol(symbol) for symbol in watchlist))
+            signals = [signal for signal in results if signal is not None]
             
             logger.info(f"Generated {len(signals)} signals successfully")
             return signals
@@ -6,23 +6,30 @@ Main integration system that ties all components together
 
 import asyncio
 import logging
+import logging.handlers
 import threading
 import time
 import signal
 import sys
-import pandas as pd
+from collections import Counter
+from functools import partial
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import schedule
+from typing import Dict, List, Optional, Callable, Awaitable
 import argparse
 
+# Optional faster event loop for the scheduler
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Import all unified modules
 from unified_config import config
 from unified_database import db
 from unified_live_data import live_data_manager, start_live_data_thread
 from unified_ai_signals import ai_signal_generator
 from unified_trading_manager import trading_manager
-from unified_web_dashboard import run_dashboard, dashboard_manager
 from unified_notifications import notification_manager
 
 # Setup logging
@@ -30,20 +37,150 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('trading_platform.log'),
+        logging.handlers.RotatingFileHandler('trading_platform.log', maxBytes=10 * 1024 * 1024,
+                                             backupCount=5, delay=True),
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Market hours: 9:15 AM to 3:30 PM IST, as seconds since midnight
+MARKET_OPEN_SECONDS = 9 * 3600 + 15 * 60
+MARKET_CLOSE_SECONDS = 15 * 3600 + 30 * 60
+
+# Trading days as a weekday bitmask (bit 0 = Monday ... bit 6 = Sunday): Mon-Fri
+TRADING_DAYS_MASK = 0b0011111
+
+# How long a portfolio summary is shared between jobs before it is rebuilt
+SUMMARY_TTL_SECONDS = 60
+
+# Longest a thread waits on a coroutine submitted to the scheduler loop
+COROUTINE_TIMEOUT_SECONDS = 120
+
+# Message templates, filled with str.format at send time
+STARTUP_MESSAGE_TEMPLATE = """
+🚀 <b>AI Trading Platform Started</b>
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📊 <b>System Status:</b> ONLINE
+💼 <b>Portfolio:</b> ₹{portfolio_value:,.2f}
+📈 <b>Active Symbols:</b> {active_symbols}
+⏰ <b>Started:</b> {started}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+✅ All systems operational and ready for trading!
+"""
+
+SIGNAL_ERROR_TEMPLATE = """
+⚠️ <b>Signal Generation Error</b>
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🕐 <b>Time:</b> {time}
+❌ <b>Error:</b> {error}...
+🔧 <b>Action:</b> System will retry automatically
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+EOD_REPORT_TEMPLATE = """
+📋 END-OF-DAY REPORT - {date}
+============================================================
+
+💼 PORTFOLIO SUMMARY:
+   Portfolio Value: ₹{portfolio_value:,.2f}
+   Cash Balance: ₹{cash_balance:,.2f}
+   Total P&L: ₹{total_pnl:,.2f}
+   Active Positions: {total_positions}
+   
+🎯 TODAY'S SIGNALS:
+   Total Signals: {signal_count}
+   BUY Signals: {buy_signals}
+   SELL Signals: {sell_signals}
+   
+💰 TODAY'S TRADES:
+   Completed Trades: {trade_count}
+   Total P&L: ₹{today_pnl:.2f}
+   
+📊 PERFORMANCE STATS:
+   Win Rate: {win_rate:.1f}%
+   Total Trades: {total_trades}
+   Orders Placed Today: {orders_placed}
+   Signals Generated Today: {signal_count}
+   
+⏱️  SYSTEM UPTIME:
+   Started: {started}
+   Uptime: {uptime}
+
+============================================================
+"""
+
+EOD_TELEGRAM_TEMPLATE = """
+📋 <b>End-of-Day Report</b>
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📅 <b>Date:</b> {date}
+
+💼 <b>Portfolio Summary:</b>
+• Value: ₹{portfolio_value:,.2f}
+• Cash: ₹{cash_balance:,.2f}
+• P&L: ₹{total_pnl:,.2f}
+• Positions: {total_positions}
+
+🎯 <b>Today's Activity:</b>
+• Signals: {signal_count}
+• Trades: {trade_count}
+• Orders: {orders_placed}
+
+📊 <b>Performance:</b>
+• Win Rate: {win_rate:.1f}%
+• Total Trades: {total_trades}
+
+⏱️ <b>Uptime:</b> {uptime}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+SHUTDOWN_MESSAGE_TEMPLATE = """
+🛑 <b>Trading Platform Stopped</b>
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+⏰ <b>Shutdown Time:</b> {shutdown_time}
+📊 <b>Session Uptime:</b> {uptime}
+🎯 <b>Signals Generated:</b> {signals_generated}
+📋 <b>Orders Placed:</b> {orders_placed}
+💰 <b>Session P&L:</b> ₹{total_pnl:,.2f}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+✅ Platform stopped gracefully
+"""
+
+HOURLY_STATUS_TEMPLATE = """
+📊 <b>Hourly Status Update</b> - {time}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+💼 <b>Portfolio:</b> ₹{portfolio_value:,.2f}
+📈 <b>Day P&L:</b> ₹{total_pnl:,.2f}
+🎯 <b>Active Positions:</b> {total_positions}
+📋 <b>Signals Today:</b> {signals_generated}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🟢 System running smoothly
+"""
+
+STATUS_TEMPLATE = """📊 STATUS UPDATE - {time}
+   Market: {market_status} | Portfolio: ₹{portfolio_value:,.2f} | P&L: ₹{total_pnl:,.2f}
+   Positions: {total_positions} | Orders: {active_orders} | Trades: {total_trades}"""
+
+def _write_report(path: str, report: str):
+    """Write a report file (run in a worker thread)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(report)
+
 class UnifiedTradingPlatform:
     """Main AI trading platform orchestrator"""
     
     def __init__(self):
         self.running = False
         self.threads = {}
+        self.jobs: List[Callable[[], Awaitable[None]]] = []
+        self.loop = None
+        self._stop_event = threading.Event()
+        self._loop_ready = threading.Event()
+        self._summary = None
+        self._summary_at = 0.0
         self.last_signal_generation = None
         self.last_portfolio_update = None
+        self.last_eod_report_date = None
         self.performance_stats = {
             'signals_generated': 0,
             'orders_placed': 0,
@@ -70,33 +207,35 @@ class UnifiedTradingPlatform:
             symbols = config.get_active_symbols()
             logger.info(f"✅ Configuration loaded - {len(symbols)} active symbols")
             
-            # 3. Live data connectivity
+            # 3-4. Live data connectivity and trading manager initialization (probed concurrently)
             logger.info("📈 Testing live data connectivity...")
-            test_quote = None
-            try:
-                test_quote = asyncio.run(live_data_manager.get_live_quote('RELIANCE'))
-                if test_quote:
-                    logger.info(f"✅ Live data connected - RELIANCE: ₹{test_quote.price:.2f}")
-                else:
-                    logger.warning("⚠️  Live data connection issue - will retry")
-            except Exception as e:
-                logger.error(f"Error during live data check: {e}", exc_info=True)
-
-            # 4. Trading manager initialization
             logger.info("💼 Initializing trading manager...")
+            test_quote, portfolio_result, historical_data = asyncio.run(self._run_startup_probes())
+            
+            if isinstance(test_quote, Exception):
+                logger.error(f"Error during live data check: {test_quote}", exc_info=test_quote)
+                test_quote = None
+            elif test_quote:
+                logger.info(f"✅ Live data connected - RELIANCE: ₹{test_quote.price:.2f}")
+            else:
+                logger.warning("⚠️  Live data connection issue - will retry")
+            
             summary = None
             try:
-                asyncio.run(trading_manager.update_portfolio_value())
-                summary = trading_manager.get_portfolio_summary()
+                if isinstance(portfolio_result, Exception):
+                    raise portfolio_result
+                summary = self._get_summary_cached(refresh=True)
                 logger.info(f"✅ Trading manager ready - Portfolio: ₹{summary['portfolio_value']:,.2f}")
             except Exception as e:
                 logger.error(f"Error during trading manager init: {e}", exc_info=True)
 
             # 5. AI signal generator test
             logger.info("🤖 Testing AI signal generator...")
+            ai_signal_generator.technical_analyzer.warm_up()
             if test_quote:
-                historical_data = live_data_manager.get_historical_data('RELIANCE')
-                if not historical_data.empty:
+                if isinstance(historical_data, Exception):
+                    logger.error(f"Error loading historical data: {historical_data}")
+                elif not historical_data.empty:
                     signal = ai_signal_generator.generate_signal('RELIANCE', test_quote, historical_data)
                     logger.info(f"✅ AI signals ready - Test signal: {signal.signal_type} ({signal.confidence:.1f}%)")
                 else:
@@ -107,16 +246,11 @@ class UnifiedTradingPlatform:
             # Send startup notification to Telegram
             if summary:
                 try:
-                    startup_message = f"""
-🚀 <b>AI Trading Platform Started</b>
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📊 <b>System Status:</b> ONLINE
-💼 <b>Portfolio:</b> ₹{summary['portfolio_value']:,.2f}
-📈 <b>Active Symbols:</b> {len(symbols)}
-⏰ <b>Started:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-✅ All systems operational and ready for trading!
-                    """
+                    startup_message = STARTUP_MESSAGE_TEMPLATE.format(
+                        portfolio_value=summary['portfolio_value'],
+                        active_symbols=len(symbols),
+                        started=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    )
                     notification_manager.send_system_notification(
                         title="🚀 Trading Platform Started",
                         message=startup_message,
@@ -132,116 +266,179 @@ class UnifiedTradingPlatform:
             logger.error(f"❌ Startup check failed: {e}", exc_info=True)
             return False
     
+    async def _run_startup_probes(self):
+        """Run the independent startup I/O probes concurrently"""
+        return await asyncio.gather(
+            live_data_manager.get_live_quote('RELIANCE'),
+            trading_manager.update_portfolio_value(),
+            asyncio.to_thread(live_data_manager.get_historical_data, 'RELIANCE'),
+            return_exceptions=True
+        )
+    
     def schedule_tasks(self):
         """Schedule recurring tasks"""
         logger.info("📅 Scheduling recurring tasks...")
         
+        self.jobs = []
+        
         # Market hours: 9:15 AM to 3:30 PM IST
         if config.FEATURES['AUTO_TRADING']:
             # Generate signals every 5 minutes during market hours
-            schedule.every(5).minutes.do(self._scheduled_signal_generation)
+            self.jobs.append(partial(self._run_every, 5 * 60, self._scheduled_signal_generation))
             
             # Process pending orders every 1 minute
-            schedule.every(1).minutes.do(self._scheduled_order_processing)
+            self.jobs.append(partial(self._run_every, 60, self._scheduled_order_processing))
             
-            # Update portfolio every 2 minutes
-            schedule.every(2).minutes.do(self._scheduled_portfolio_update)
-            
-            # Monitor positions every 30 seconds
-            schedule.every(30).seconds.do(self._scheduled_position_monitoring)
+            # Monitor positions every 30 seconds and update portfolio every 2 minutes
+            self.jobs.append(partial(self._supervise_portfolio, 30, 2 * 60))
         
         # Generate end-of-day report
-        schedule.every().day.at("15:45").do(self._scheduled_eod_report)
+        self.jobs.append(partial(self._run_daily_at, 15, 45, self._scheduled_eod_report))
         
-        # Clean up old data weekly
-        schedule.every().sunday.at("18:00").do(self._scheduled_cleanup)
+        # Clean up old data weekly (Sunday = 6)
+        self.jobs.append(partial(self._run_daily_at, 18, 0, self._scheduled_cleanup, weekday=6))
         
         logger.info("✅ Tasks scheduled successfully")
     
-    def _scheduled_signal_generation(self):
+    async def _run_job(self, job: Callable[[], Awaitable[None]]):
+        """Await a scheduled job, logging any failure"""
+        try:
+            await job()
+        except Exception as e:
+            logger.error("Error in scheduled task %s: %s", job.__name__, e)
+    
+    @staticmethod
+    async def _sleep_until(deadline: float, interval: float) -> float:
+        """Sleep until a monotonic deadline; return the next one, skipping missed slots"""
+        loop = asyncio.get_running_loop()
+        await asyncio.sleep(max(deadline - loop.time(), 0))
+        
+        # Advance on the fixed grid so job runtime never accumulates as drift
+        next_deadline = deadline + interval
+        now = loop.time()
+        if next_deadline <= now:
+            next_deadline += ((now - next_deadline) // interval + 1) * interval
+        return next_deadline
+    
+    async def _run_every(self, interval: float, job: Callable[[], Awaitable[None]]):
+        """Run a job every `interval` seconds on monotonic deadlines"""
+        deadline = asyncio.get_running_loop().time() + interval
+        while True:
+            deadline = await self._sleep_until(deadline, interval)
+            await self._run_job(job)
+    
+    async def _supervise_portfolio(self, monitor_interval: float, update_interval: float):
+        """Monitor positions and revalue the portfolio from one coroutine"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + monitor_interval
+        next_update = loop.time() + update_interval
+        while True:
+            deadline = await self._sleep_until(deadline, monitor_interval)
+            await self._run_job(self._scheduled_position_monitoring)
+            
+            if loop.time() >= next_update:
+                await self._run_job(self._scheduled_portfolio_update)
+                next_update += update_interval
+                if next_update <= loop.time():
+                    next_update = loop.time() + update_interval
+    
+    async def _run_daily_at(self, hour: int, minute: int, job: Callable[[], Awaitable[None]],
+                            weekday: Optional[int] = None):
+        """Run a job daily (or weekly on `weekday`) at the given local time"""
+        while True:
+            now = datetime.now()
+            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            if weekday is not None:
+                next_run += timedelta(days=(weekday - next_run.weekday()) % 7)
+            
+            await asyncio.sleep((next_run - now).total_seconds())
+            await self._run_job(job)
+    
+    async def _scheduled_signal_generation(self):
         """Scheduled AI signal generation"""
         if not self._is_market_hours():
             return
         
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            signals = await ai_signal_generator.generate_signals_for_watchlist()
             
-            signals = loop.run_until_complete(ai_signal_generator.generate_signals_for_watchlist())
+            # Partition by confidence in a single pass
+            strong_signals = []
+            high_confidence = []
+            for signal in signals:
+                if signal.confidence >= config.MIN_SIGNAL_CONFIDENCE:
+                    strong_signals.append(signal)
+                if signal.confidence >= 75.0:  # Only send high confidence signals
+                    high_confidence.append(signal)
             
             # Process strong signals automatically
             if config.FEATURES['AUTO_TRADING']:
-                for signal in signals:
-                    if signal.confidence >= config.MIN_SIGNAL_CONFIDENCE:
-                        processed = loop.run_until_complete(trading_manager.process_ai_signal(signal))
-                        if processed:
-                            self.performance_stats['orders_placed'] += 1
-                            logger.info(f"🎯 Auto-processed signal: {signal.symbol} {signal.signal_type}")
-            
-            loop.close()
+                results = await asyncio.gather(
+                    *(trading_manager.process_ai_signal(signal) for signal in strong_signals),
+                    return_exceptions=True
+                )
+                processed_signals = [signal for signal, processed in zip(strong_signals, results) if processed is True]
+                self.performance_stats['orders_placed'] += len(processed_signals)
+                for signal in processed_signals:
+                    logger.info("🎯 Auto-processed signal: %s %s", signal.symbol, signal.signal_type)
             
             self.performance_stats['signals_generated'] += len(signals)
             self.last_signal_generation = datetime.now()
             
-            buy_signals = len([s for s in signals if s.signal_type == 'BUY'])
-            sell_signals = len([s for s in signals if s.signal_type == 'SELL'])
+            signal_counts = Counter(s.signal_type for s in signals)
+            buy_signals, sell_signals = signal_counts['BUY'], signal_counts['SELL']
             
-            logger.info(f"🎯 Generated {len(signals)} signals - BUY: {buy_signals}, SELL: {sell_signals}")
+            logger.info("🎯 Generated %d signals - BUY: %d, SELL: %d", len(signals), buy_signals, sell_signals)
             
             # Send high-confidence signals to Telegram
-            if signals:
+            if high_confidence:
                 try:
-                    for signal in signals:
-                        if signal.confidence >= 75.0:  # Only send high confidence signals
-                            notification_manager.send_signal_notification(signal)
-                            logger.info(f"📱 High-confidence signal sent to Telegram: {signal.symbol}")
+                    await asyncio.gather(*(
+                        asyncio.to_thread(notification_manager.send_signal_notification, signal)
+                        for signal in high_confidence
+                    ))
+                    for signal in high_confidence:
+                        logger.info("📱 High-confidence signal sent to Telegram: %s", signal.symbol)
                 except Exception as e:
-                    logger.warning(f"⚠️ Could not send signal notifications: {e}")
+                    logger.warning("⚠️ Could not send signal notifications: %s", e)
             
         except Exception as e:
-            logger.error(f"Error in scheduled signal generation: {e}")
+            logger.error("Error in scheduled signal generation: %s", e)
             # Send error alert to Telegram
             try:
-                error_message = f"""
-⚠️ <b>Signal Generation Error</b>
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-🕐 <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}
-❌ <b>Error:</b> {str(e)[:200]}...
-🔧 <b>Action:</b> System will retry automatically
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-                """
-                notification_manager.send_system_notification(
+                error_message = SIGNAL_ERROR_TEMPLATE.format(
+                    time=datetime.now().strftime('%H:%M:%S'),
+                    error=str(e)[:200]
+                )
+                await asyncio.to_thread(
+                    notification_manager.send_system_notification,
                     title="⚠️ Signal Generation Error",
                     message=error_message,
                     priority="high"
                 )
-            except:
+            except Exception:
                 pass  # Don't let notification errors break the main process
     
-    def _scheduled_order_processing(self):
+    async def _scheduled_order_processing(self):
         """Scheduled order processing"""
         if not self._is_market_hours():
             return
         
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(trading_manager.process_pending_orders())
-            loop.close()
+            await trading_manager.process_pending_orders()
             
         except Exception as e:
-            logger.error(f"Error in scheduled order processing: {e}")
+            logger.error("Error in scheduled order processing: %s", e)
     
-    def _scheduled_portfolio_update(self):
+    async def _scheduled_portfolio_update(self):
         """Scheduled portfolio update"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(trading_manager.update_portfolio_value())
-            loop.close()
+            await trading_manager.update_portfolio_value()
             
             # Update performance stats
-            summary = trading_manager.get_portfolio_summary()
+            summary = self._get_summary_cached(refresh=True)
             self.performance_stats['total_pnl'] = summary['total_pnl']
             self.performance_stats['win_rate'] = summary['win_rate']
             self.performance_stats['trades_completed'] = summary['total_trades']
@@ -249,182 +446,155 @@ class UnifiedTradingPlatform:
             self.last_portfolio_update = datetime.now()
             
         except Exception as e:
-            logger.error(f"Error in scheduled portfolio update: {e}")
+            logger.error("Error in scheduled portfolio update: %s", e)
     
-    def _scheduled_position_monitoring(self):
+    async def _scheduled_position_monitoring(self):
         """Scheduled position monitoring"""
         if not self._is_market_hours():
             return
         
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(trading_manager.monitor_positions())
-            loop.close()
+            await trading_manager.monitor_positions()
             
         except Exception as e:
-            logger.error(f"Error in scheduled position monitoring: {e}")
+            logger.error("Error in scheduled position monitoring: %s", e)
     
-    def _scheduled_eod_report(self):
+    async def _scheduled_eod_report(self):
         """Generate end-of-day report"""
         try:
             logger.info("📋 Generating end-of-day report...")
+            now = datetime.now()
             
-            # Update portfolio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(trading_manager.update_portfolio_value())
-            loop.close()
+            # Update portfolio unless the scheduled update just did
+            portfolio_stale = (self.last_portfolio_update is None or
+                               now - self.last_portfolio_update > timedelta(seconds=60))
+            if portfolio_stale:
+                await trading_manager.update_portfolio_value()
             
             # Get summary
-            summary = trading_manager.get_portfolio_summary()
-            
-            # Get today's trades  
-            trades_data = db.get_trades(limit=100)
-            if isinstance(trades_data, pd.DataFrame) and not trades_data.empty and 'created_at' in trades_data.columns:
-                today_trades = trades_data[trades_data['created_at'].dt.date == datetime.now().date()]
-            elif isinstance(trades_data, list):
-                # Convert list to DataFrame if needed
-                today_trades = pd.DataFrame(trades_data) if trades_data else pd.DataFrame()
-            else:
-                today_trades = pd.DataFrame()
-            
-            # Get today's signals
-            signals_data = db.get_signals(limit=500)
-            if isinstance(signals_data, pd.DataFrame) and not signals_data.empty and 'created_at' in signals_data.columns:
-                today_signals = signals_data[signals_data['created_at'].dt.date == datetime.now().date()]
-            elif isinstance(signals_data, list):
-                # Convert list to DataFrame if needed
-                today_signals = pd.DataFrame(signals_data) if signals_data else pd.DataFrame()
-            else:
-                today_signals = pd.DataFrame()
+            summary = self._get_summary_cached(refresh=portfolio_stale)
+            
+            # Get today's trades and signals (filtered in SQL)
+            today_start = datetime.combine(now.date(), datetime.min.time())
+            today_trades, today_signals = await asyncio.gather(
+                asyncio.to_thread(db.get_trades, limit=100, since=today_start),
+                asyncio.to_thread(db.get_signals, limit=500, since=today_start)
+            )
+            
+            signal_counts = Counter(s['signal_type'] for s in today_signals)
+            buy_signals, sell_signals = signal_counts['BUY'], signal_counts['SELL']
+            today_pnl = today_trades['pnl'].sum() if 'pnl' in today_trades.columns else 0
             
             # Generate report
-            report = f"""
-📋 END-OF-DAY REPORT - {datetime.now().strftime('%Y-%m-%d')}
-{'='*60}
-
-💼 PORTFOLIO SUMMARY:
-   Portfolio Value: ₹{summary['portfolio_value']:,.2f}
-   Cash Balance: ₹{summary['cash_balance']:,.2f}
-   Total P&L: ₹{summary['total_pnl']:,.2f}
-   Active Positions: {summary['total_positions']}
-   
-🎯 TODAY'S SIGNALS:
-   Total Signals: {len(today_signals)}
-   BUY Signals: {len(today_signals[today_signals['signal_type'] == 'BUY']) if not today_signals.empty and 'signal_type' in today_signals.columns else 0}
-   SELL Signals: {len(today_signals[today_signals['signal_type'] == 'SELL']) if not today_signals.empty and 'signal_type' in today_signals.columns else 0}
-   
-💰 TODAY'S TRADES:
-   Completed Trades: {len(today_trades)}
-   Total P&L: ₹{today_trades['pnl'].sum() if not today_trades.empty and 'pnl' in today_trades.columns else 0:.2f}
-   
-📊 PERFORMANCE STATS:
-   Win Rate: {summary['win_rate']:.1f}%
-   Total Trades: {summary['total_trades']}
-   Orders Placed Today: {self.performance_stats['orders_placed']}
-   Signals Generated Today: {len(today_signals)}
-   
-⏱️  SYSTEM UPTIME:
-   Started: {self.performance_stats['uptime_start'].strftime('%Y-%m-%d %H:%M:%S')}
-   Uptime: {datetime.now() - self.performance_stats['uptime_start']}
-
-{'='*60}
-            """
+            report_values = {
+                'date': now.strftime('%Y-%m-%d'),
+                'portfolio_value': summary['portfolio_value'],
+                'cash_balance': summary['cash_balance'],
+                'total_pnl': summary['total_pnl'],
+                'total_positions': summary['total_positions'],
+                'signal_count': len(today_signals),
+                'buy_signals': buy_signals,
+                'sell_signals': sell_signals,
+                'trade_count': len(today_trades),
+                'today_pnl': today_pnl,
+                'win_rate': summary['win_rate'],
+                'total_trades': summary['total_trades'],
+                'orders_placed': self.performance_stats['orders_placed'],
+                'started': self.performance_stats['uptime_start'].strftime('%Y-%m-%d %H:%M:%S'),
+                'uptime': now - self.performance_stats['uptime_start']
+            }
+            report = EOD_REPORT_TEMPLATE.format(**report_values)
             
             logger.info(report)
             
             # Send EOD report to Telegram
             try:
-                eod_telegram_message = f"""
-📋 <b>End-of-Day Report</b>
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📅 <b>Date:</b> {datetime.now().strftime('%Y-%m-%d')}
-
-💼 <b>Portfolio Summary:</b>
-• Value: ₹{summary['portfolio_value']:,.2f}
-• Cash: ₹{summary['cash_balance']:,.2f}
-• P&L: ₹{summary['total_pnl']:,.2f}
-• Positions: {summary['total_positions']}
-
-🎯 <b>Today's Activity:</b>
-• Signals: {len(today_signals)}
-• Trades: {len(today_trades)}
-• Orders: {self.performance_stats['orders_placed']}
-
-📊 <b>Performance:</b>
-• Win Rate: {summary['win_rate']:.1f}%
-• Total Trades: {summary['total_trades']}
-
-⏱️ <b>Uptime:</b> {datetime.now() - self.performance_stats['uptime_start']}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-                """
-                notification_manager.send_system_notification(
+                eod_telegram_message = EOD_TELEGRAM_TEMPLATE.format(**report_values)
+                await asyncio.to_thread(
+                    notification_manager.send_system_notification,
                     title="📋 End-of-Day Report",
                     message=eod_telegram_message,
                     priority="medium"
                 )
                 logger.info("📱 EOD report sent to Telegram")
             except Exception as e:
-                logger.warning(f"⚠️ Could not send EOD report: {e}")
+                logger.warning("⚠️ Could not send EOD report: %s", e)
+            
+            # Save report to file off the event loop
+            await asyncio.to_thread(_write_report, f"eod_report_{now.strftime('%Y%m%d')}.txt", report)
             
-            # Save report to file
-            with open(f"eod_report_{datetime.now().strftime('%Y%m%d')}.txt", 'w', encoding='utf-8') as f:
-                f.write(report)
+            self.last_eod_report_date = now.date()
                 
         except Exception as e:
-            logger.error(f"Error generating EOD report: {e}")
+            logger.error("Error generating EOD report: %s", e)
     
-    def _scheduled_cleanup(self):
+    async def _scheduled_cleanup(self):
         """Clean up old data"""
         try:
             logger.info("🧹 Performing weekly cleanup...")
             
             # Clean old signals (keep last 30 days)
             cutoff_date = datetime.now() - timedelta(days=30)
-            db.cleanup_old_signals(cutoff_date)
+            await asyncio.to_thread(db.cleanup_old_signals, cutoff_date)
             
             # Clean old live data (keep last 7 days)
             cutoff_date = datetime.now() - timedelta(days=7)
-            db.cleanup_old_live_data(cutoff_date)
+            await asyncio.to_thread(db.cleanup_old_live_data, cutoff_date)
             
             logger.info("✅ Cleanup completed")
             
         except Exception as e:
-            logger.error(f"Error in cleanup: {e}")
+            logger.error("Error in cleanup: %s", e)
+    
+    def _get_summary_cached(self, refresh: bool = False) -> Dict:
+        """Portfolio summary shared across jobs for up to SUMMARY_TTL_SECONDS"""
+        now = time.monotonic()
+        if refresh or self._summary is None or now - self._summary_at > SUMMARY_TTL_SECONDS:
+            self._summary = trading_manager.get_portfolio_summary()
+            self._summary_at = now
+        return self._summary
     
     def _is_market_hours(self) -> bool:
         """Check if current time is within market hours"""
         now = datetime.now()
+        seconds = now.hour * 3600 + now.minute * 60 + now.second
         
-        # Skip weekends
-        if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            return False
-        
-        # Market hours: 9:15 AM to 3:30 PM IST
-        market_open = now.replace(hour=9, minute=15, second=0, microsecond=0)
-        market_close = now.replace(hour=15, minute=30, second=0, microsecond=0)
-        
-        return market_open <= now <= market_close
+        # Trading day bit for today, then market hours: 9:15 AM to 3:30 PM IST
+        return (bool((TRADING_DAYS_MASK >> now.weekday()) & 1) and
+                MARKET_OPEN_SECONDS <= seconds <= MARKET_CLOSE_SECONDS)
     
     def _run_scheduler(self):
-        """Run the task scheduler"""
+        """Run the task scheduler on a persistent event loop"""
         logger.info("⏰ Task scheduler started")
         
-        while self.running:
-            try:
-                schedule.run_pending()
-                time.sleep(1)
-            except Exception as e:
-                logger.error(f"Error in scheduler: {e}")
-                time.sleep(5)
+        loop = self.loop
+        asyncio.set_event_loop(loop)
+        # Job coroutines are created here so none exist unless the loop runs them
+        tasks = [loop.create_task(job()) for job in self.jobs]
+        loop.call_soon(self._loop_ready.set)
+        
+        try:
+            loop.run_forever()
+        finally:
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
         
         logger.info("⏰ Task scheduler stopped")
     
+    def _run_coroutine(self, coro, timeout: float = COROUTINE_TIMEOUT_SECONDS):
+        """Run a coroutine on the scheduler loop, or on a temporary loop if it is not running"""
+        if self.loop is not None and self.loop.is_running():
+            return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+        return asyncio.run(coro)
+    
     def _run_dashboard(self):
         """Run the web dashboard"""
         try:
             logger.info("🌐 Starting web dashboard...")
+            # Imported here so runs without the dashboard never load Flask
+            from unified_web_dashboard import run_dashboard
             run_dashboard(host='0.0.0.0', port=5000, debug=False)
         except Exception as e:
             logger.error(f"Error running dashboard: {e}")
@@ -462,9 +632,13 @@ class UnifiedTradingPlatform:
             # Schedule recurring tasks
             if enable_scheduler:
                 self.schedule_tasks()
+                self.loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+                trading_manager.loop = self.loop  # Dashboard orders join the scheduler loop
                 scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
                 scheduler_thread.start()
                 self.threads['scheduler'] = scheduler_thread
+                if not self._loop_ready.wait(timeout=5):
+                    logger.warning("⚠️ Scheduler loop did not start within 5 seconds")
                 logger.info("✅ Task scheduler started")
             
             # Start web dashboard
@@ -477,7 +651,7 @@ class UnifiedTradingPlatform:
             # Initial signal generation
             if config.FEATURES['AUTO_TRADING'] and self._is_market_hours():
                 logger.info("🎯 Generating initial signals...")
-                self._scheduled_signal_generation()
+                self._run_coroutine(self._scheduled_signal_generation())
             
             # Main monitoring loop
             logger.info("🎉 PLATFORM STARTED SUCCESSFULLY!")
@@ -488,30 +662,35 @@ class UnifiedTradingPlatform:
             logger.info("💼 Paper Trading: " + ("ENABLED" if config.FEATURES['PAPER_TRADING'] else "DISABLED"))
             logger.info("="*60)
             
-            # Keep main thread alive
+            # Keep main thread alive, waking only for the 10-minute status
+            next_status = self._next_status_time(datetime.now())
             while self.running:
                 try:
+                    timeout = (next_status - datetime.now()).total_seconds()
+                    if self._stop_event.wait(max(timeout, 0)):
+                        break
+                    
                     # Print periodic status
-                    if datetime.now().minute % 10 == 0 and datetime.now().second == 0:
-                        self._print_status()
+                    self._print_status()
                     
                     # Send hourly status to Telegram (during market hours)
                     if (self._is_market_hours() and 
-                        datetime.now().minute == 0 and datetime.now().second == 0 and
-                        datetime.now().hour in [10, 12, 14]):  # 10 AM, 12 PM, 2 PM
+                        next_status.minute == 0 and
+                        next_status.hour in [10, 12, 14]):  # 10 AM, 12 PM, 2 PM
                         try:
                             self._send_hourly_status()
                         except Exception as e:
-                            logger.warning(f"⚠️ Could not send hourly status: {e}")
+                            logger.warning("⚠️ Could not send hourly status: %s", e)
                     
-                    time.sleep(1)
+                    next_status = self._next_status_time(max(datetime.now(), next_status))
                     
                 except KeyboardInterrupt:
                     logger.info("🛑 Keyboard interrupt received")
                     break
-                except Exception as e:
-                    logger.error(f"Error in main loop: {e}")
-                    time.sleep(5)
+                except (OSError, RuntimeError) as e:
+                    # Transient failures: retry shortly; anything else stops the platform
+                    logger.exception("Error in main loop: %s", e)
+                    self._stop_event.wait(0.5)
             
             return True
             
@@ -531,21 +710,18 @@ class UnifiedTradingPlatform:
         logger.info("="*50)
         
         self.running = False
+        self._stop_event.set()
+        now = datetime.now()
         
         # Send shutdown notification to Telegram
         try:
-            uptime = datetime.now() - self.performance_stats['uptime_start']
-            shutdown_message = f"""
-🛑 <b>Trading Platform Stopped</b>
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-⏰ <b>Shutdown Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-📊 <b>Session Uptime:</b> {uptime}
-🎯 <b>Signals Generated:</b> {self.performance_stats['signals_generated']}
-📋 <b>Orders Placed:</b> {self.performance_stats['orders_placed']}
-💰 <b>Session P&L:</b> ₹{self.performance_stats['total_pnl']:,.2f}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-✅ Platform stopped gracefully
-            """
+            shutdown_message = SHUTDOWN_MESSAGE_TEMPLATE.format(
+                shutdown_time=now.strftime('%Y-%m-%d %H:%M:%S'),
+                uptime=now - self.performance_stats['uptime_start'],
+                signals_generated=self.performance_stats['signals_generated'],
+                orders_placed=self.performance_stats['orders_placed'],
+                total_pnl=self.performance_stats['total_pnl']
+            )
             notification_manager.send_system_notification(
                 title="🛑 Trading Platform Stopped",
                 message=shutdown_message,
@@ -555,11 +731,17 @@ class UnifiedTradingPlatform:
         except Exception as e:
             logger.warning(f"⚠️ Could not send shutdown notification: {e}")
         
-        # Generate final report
-        try:
-            self._scheduled_eod_report()
-        except:
-            pass
+        # Generate final report once per day, only after the market has closed
+        after_close = now.hour * 3600 + now.minute * 60 + now.second > MARKET_CLOSE_SECONDS
+        if after_close and self.last_eod_report_date != now.date():
+            try:
+                self._run_coroutine(self._scheduled_eod_report())
+            except:
+                pass
+        
+        # Stop the scheduler loop; its thread cancels pending jobs on exit
+        if self.loop and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.loop.stop)
         
         # Wait for threads to finish
         for name, thread in self.threads.items():
@@ -570,49 +752,55 @@ class UnifiedTradingPlatform:
         logger.info("✅ Platform stopped gracefully")
         logger.info("="*50)
     
+    @staticmethod
+    def _next_status_time(now: datetime) -> datetime:
+        """Next 10-minute boundary strictly after `now`"""
+        return now.replace(second=0, microsecond=0) + timedelta(minutes=10 - now.minute % 10)
+    
     def _print_status(self):
         """Print current status"""
         try:
-            summary = trading_manager.get_portfolio_summary()
+            summary = self._get_summary_cached()
             market_status = "OPEN" if self._is_market_hours() else "CLOSED"
             
-            status = f"""
-📊 STATUS UPDATE - {datetime.now().strftime('%H:%M:%S')}
-   Market: {market_status} | Portfolio: ₹{summary['portfolio_value']:,.2f} | P&L: ₹{summary['total_pnl']:,.2f}
-   Positions: {summary['total_positions']} | Orders: {summary['active_orders']} | Trades: {summary['total_trades']}
-            """.strip()
+            status = STATUS_TEMPLATE.format(
+                time=datetime.now().strftime('%H:%M:%S'),
+                market_status=market_status,
+                portfolio_value=summary['portfolio_value'],
+                total_pnl=summary['total_pnl'],
+                total_positions=summary['total_positions'],
+                active_orders=summary['active_orders'],
+                total_trades=summary['total_trades']
+            )
             
             logger.info(status)
             
         except Exception as e:
-            logger.error(f"Error printing status: {e}")
+            logger.error("Error printing status: %s", e)
     
     def _send_hourly_status(self):
         """Send hourly status update to Telegram"""
         try:
-            summary = trading_manager.get_portfolio_summary()
+            summary = self._get_summary_cached()
             current_time = datetime.now().strftime('%H:%M')
             
-            hourly_message = f"""
-📊 <b>Hourly Status Update</b> - {current_time}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-💼 <b>Portfolio:</b> ₹{summary['portfolio_value']:,.2f}
-📈 <b>Day P&L:</b> ₹{summary['total_pnl']:,.2f}
-🎯 <b>Active Positions:</b> {summary['total_positions']}
-📋 <b>Signals Today:</b> {self.performance_stats['signals_generated']}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-🟢 System running smoothly
-            """
+            hourly_message = HOURLY_STATUS_TEMPLATE.format(
+                time=current_time,
+                portfolio_value=summary['portfolio_value'],
+                total_pnl=summary['total_pnl'],
+                total_positions=summary['total_positions'],
+                signals_generated=self.performance_stats['signals_generated']
+            )
             
             notification_manager.send_system_notification(
                 title=f"📊 Status Update - {current_time}",
                 message=hourly_message,
                 priority="low"
             )
-            logger.info(f"📱 Hourly status sent to Telegram at {current_time}")
+            logger.info("📱 Hourly status sent to Telegram at %s", current_time)
             
         except Exception as e:
-            logger.error(f"Error sending hourly status: {e}")
+            logger.error("Error sending hourly status: %s", e)
 
 def main():
     """Main entry point"""
@@ -5,14 +5,20 @@ Central configuration hub for all system components
 """
 
 import os
-from dataclasses import dataclass, field
-from typing import List, Dict, Any
+import time
+from datetime import datetime
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
+import pytz
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-@dataclass
+# Seconds to reuse a market-hours check before recomputing
+MARKET_HOURS_CACHE_TTL = 1.0
+
+@dataclass(slots=True)
 class UnifiedConfig:
     """Unified configuration for the entire AI trading platform"""
     
@@ -183,6 +189,24 @@ class UnifiedConfig:
     ENABLE_BACKTESTING: bool = True
     ENABLE_TECHNICAL_ANALYSIS: bool = True
     
+    # ================================
+    # MARKET HOURS CACHE (internal)
+    # ================================
+    _market_tz: Any = field(default=None, init=False, repr=False, compare=False)
+    _market_start: Any = field(default=None, init=False, repr=False, compare=False)
+    _market_end: Any = field(default=None, init=False, repr=False, compare=False)
+    _market_hours_checked_at: float = field(default=float('-inf'), init=False, repr=False, compare=False)
+    _market_hours_result: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    
+    # ================================
+    # SYMBOL LOOKUPS (internal)
+    # ================================
+    _all_symbols: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _international_set: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.refresh_symbol_cache()
+    
     @property
     def FEATURES(self) -> Dict[str, bool]:
         """Feature flags dictionary for backward compatibility"""
@@ -203,37 +227,47 @@ class UnifiedConfig:
     
     def get_all_symbols(self) -> List[str]:
         """Get all available symbols"""
-        return list(set(
+        return list(self._all_symbols)
+    
+    def is_international(self, symbol: str) -> bool:
+        """Check if symbol is listed outside NSE"""
+        return symbol in self._international_set
+    
+    def refresh_symbol_cache(self):
+        """Rebuild symbol lookups after a watchlist changes"""
+        self._all_symbols = tuple(dict.fromkeys(
             self.NIFTY_50_SYMBOLS + 
             self.FNO_SYMBOLS + 
             self.ACTIVE_WATCHLIST + 
             self.INTERNATIONAL_SYMBOLS
         ))
+        self._international_set = frozenset(self.INTERNATIONAL_SYMBOLS)
     
     def is_market_hours(self) -> bool:
         """Check if current time is within market hours"""
-        from datetime import datetime
-        import pytz
+        checked_at = time.monotonic()
+        if checked_at - self._market_hours_checked_at < MARKET_HOURS_CACHE_TTL:
+            return self._market_hours_result
         
         try:
-            tz = pytz.timezone(self.TIMEZONE)
-            now = datetime.now(tz)
-            current_time = now.time()
+            # Resolve timezone and session bounds once
+            if self._market_tz is None:
+                self._market_start = datetime.strptime(self.MARKET_START_TIME, "%H:%M").time()
+                self._market_end = datetime.strptime(self.MARKET_END_TIME, "%H:%M").time()
+                self._market_tz = pytz.timezone(self.TIMEZONE)
             
-            start_time = datetime.strptime(self.MARKET_START_TIME, "%H:%M").time()
-            end_time = datetime.strptime(self.MARKET_END_TIME, "%H:%M").time()
-            
-            return start_time <= current_time <= end_time
-        except:
-            return True  # Default to allowing trading if timezone check fails
+            current_time = datetime.now(self._market_tz).time()
+            result = self._market_start <= current_time <= self._market_end
+        except Exception:
+            result = True  # Default to allowing trading if timezone check fails
+        
+        self._market_hours_checked_at = checked_at
+        self._market_hours_result = result
+        return result
     
     def get_config_dict(self) -> Dict[str, Any]:
         """Get configuration as dictionary"""
-        return {
-            key: getattr(self, key) 
-            for key in dir(self) 
-            if not key.startswith('_') and not callable(getattr(self, key))
-        }
+        return {key: getattr(self, key) for key in CONFIG_DICT_KEYS}
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key with optional default"""
@@ -269,6 +303,9 @@ class UnifiedConfig:
         
         return issues
 
+# Public settings plus FEATURES, in the sorted order dir() used to give
+CONFIG_DICT_KEYS = tuple(sorted([f.name for f in fields(UnifiedConfig) if f.init] + ['FEATURES']))
+
 # Create global configuration instance
 config = UnifiedConfig()
 
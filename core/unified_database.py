@@ -7,7 +7,7 @@ Centralized database operations for the entire trading platform
 import sqlite3
 import pandas as pd
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
@@ -68,6 +68,32 @@ class OrderRecord:
         if self.timestamp is None:
             self.timestamp = datetime.now()
 
+def _utc_timestamp(value: datetime) -> str:
+    """Format a local datetime like SQLite's CURRENT_TIMESTAMP (UTC) for created_at comparisons"""
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+LIVE_QUOTE_INSERT_SQL = '''
+    INSERT OR REPLACE INTO live_quotes 
+    (symbol, price, open_price, high_price, low_price, volume,
+     change_amount, change_percentage, last_trade_time, data_source)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+def _live_quote_row(symbol: str, quote_data: Dict[str, Any]) -> Tuple:
+    """Map a LiveQuote dict onto the live_quotes column order"""
+    return (
+        symbol,
+        quote_data.get('price', 0),
+        quote_data.get('open', 0),
+        quote_data.get('high', 0),
+        quote_data.get('low', 0),
+        quote_data.get('volume', 0),
+        quote_data.get('change', 0),
+        quote_data.get('change_percent', 0),
+        quote_data.get('timestamp'),
+        quote_data.get('source', 'YAHOO')
+    )
+
 class UnifiedDatabaseManager:
     """Centralized database manager for all platform data"""
     
@@ -684,17 +710,25 @@ class UnifiedDatabaseManager:
         finally:
             conn.close()
     
-    def get_recent_signals(self, limit: int = 20) -> List[Dict]:
-        """Get recent AI signals"""
+    def get_recent_signals(self, limit: int = 20, since: datetime = None) -> List[Dict]:
+        """Get recent AI signals, optionally only those created at or after `since`"""
         conn = self.get_connection()
         try:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM signals 
-                WHERE is_active = TRUE 
-                ORDER BY created_at DESC 
-                LIMIT ?
-            ''', (limit,))
+            if since:
+                cursor.execute('''
+                    SELECT * FROM signals 
+                    WHERE is_active = TRUE AND created_at >= ? 
+                    ORDER BY created_at DESC 
+                    LIMIT ?
+                ''', (_utc_timestamp(since), limit))
+            else:
+                cursor.execute('''
+                    SELECT * FROM signals 
+                    WHERE is_active = TRUE 
+                    ORDER BY created_at DESC 
+                    LIMIT ?
+                ''', (limit,))
             
             signals = []
             for row in cursor.fetchall():
@@ -711,14 +745,23 @@ class UnifiedDatabaseManager:
         finally:
             conn.close()
     
-    def get_signals(self, limit: int = 50) -> List[Dict]:
+    def get_signals(self, limit: int = 50, since: datetime = None) -> List[Dict]:
         """Get signals for web dashboard"""
-        return self.get_recent_signals(limit)
+        return self.get_recent_signals(limit, since)
     
-    def get_trades(self, limit: int = 100) -> pd.DataFrame:
-        """Get recent trades"""
+    def get_trades(self, limit: int = 100, since: datetime = None) -> pd.DataFrame:
+        """Get recent trades, optionally only those created at or after `since`"""
         try:
             with self.get_connection() as conn:
+                if since:
+                    query = '''
+                        SELECT * FROM trades 
+                        WHERE created_at >= ? 
+                        ORDER BY created_at DESC 
+                        LIMIT ?
+                    '''
+                    return pd.read_sql_query(query, conn, params=(_utc_timestamp(since), limit))
+                
                 query = '''
                     SELECT * FROM trades 
                     ORDER BY created_at DESC 
@@ -741,23 +784,7 @@ class UnifiedDatabaseManager:
             cursor = conn.cursor()
             
             # Use INSERT OR REPLACE to handle concurrent updates
-            cursor.execute('''
-                INSERT OR REPLACE INTO live_quotes 
-                (symbol, price, open_price, high_price, low_price, volume,
-                 change_amount, change_percentage, last_trade_time, data_source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                symbol,
-                quote_data.get('price', 0),
-                quote_data.get('open', 0),
-                quote_data.get('high', 0),
-                quote_data.get('low', 0),
-                quote_data.get('volume', 0),
-                quote_data.get('change', 0),
-                quote_data.get('change_percent', 0),
-                quote_data.get('timestamp'),
-                quote_data.get('source', 'YAHOO')
-            ))
+            cursor.execute(LIVE_QUOTE_INSERT_SQL, _live_quote_row(symbol, quote_data))
             
             conn.commit()
             
@@ -777,6 +804,34 @@ class UnifiedDatabaseManager:
             if conn:
                 conn.close()
     
+    def store_live_quotes_bulk(self, quotes: List[Tuple[str, Dict[str, Any]]]):
+        """Store a batch of live quotes in a single transaction"""
+        if not quotes:
+            return
+        
+        conn = None
+        try:
+            conn = self.get_connection()
+            conn.executemany(LIVE_QUOTE_INSERT_SQL,
+                             [_live_quote_row(symbol, quote_data) for symbol, quote_data in quotes])
+            conn.commit()
+            
+        except sqlite3.OperationalError as e:
+            if "database is locked" in str(e):
+                # Log but don't raise - this is expected under high concurrency
+                logger.debug(f"Database temporarily locked - skipping {len(quotes)} quote updates")
+            else:
+                logger.error(f"Database error storing {len(quotes)} quotes: {e}")
+            if conn:
+                conn.rollback()
+        except Exception as e:
+            logger.error(f"Error storing {len(quotes)} quotes: {e}")
+            if conn:
+                conn.rollback()
+        finally:
+            if conn:
+                conn.close()
+    
     def get_live_quotes(self, symbols: List[str] = None) -> List[Dict]:
         """Get latest live quotes"""
         conn = self.get_connection()
@@ -823,21 +878,21 @@ class UnifiedDatabaseManager:
         try:
             cursor = conn.cursor()
             
-            # Basic stats
-            cursor.execute('SELECT COUNT(*) as total_trades FROM trades')
-            total_trades = cursor.fetchone()['total_trades']
-            
-            cursor.execute('SELECT COUNT(DISTINCT symbol) as unique_symbols FROM trades')
-            unique_symbols = cursor.fetchone()['unique_symbols']
-            
-            cursor.execute('SELECT SUM(pnl) as total_pnl FROM trades WHERE pnl IS NOT NULL')
-            total_pnl = cursor.fetchone()['total_pnl'] or 0
-            
-            cursor.execute('SELECT COUNT(*) as winning_trades FROM trades WHERE pnl > 0')
-            winning_trades = cursor.fetchone()['winning_trades']
-            
-            cursor.execute('SELECT COUNT(*) as losing_trades FROM trades WHERE pnl < 0')
-            losing_trades = cursor.fetchone()['losing_trades']
+            # Basic stats in a single pass over trades
+            cursor.execute('''
+                SELECT COUNT(*) as total_trades,
+                       COUNT(DISTINCT symbol) as unique_symbols,
+                       SUM(pnl) as total_pnl,
+                       SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as winning_trades,
+                       SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END) as losing_trades
+                FROM trades
+            ''')
+            row = cursor.fetchone()
+            total_trades = row['total_trades']
+            unique_symbols = row['unique_symbols']
+            total_pnl = row['total_pnl'] or 0
+            winning_trades = row['winning_trades'] or 0
+            losing_trades = row['losing_trades'] or 0
             
             win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
             
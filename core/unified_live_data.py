@@ -8,14 +8,14 @@ import asyncio
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple, Deque
 import logging
 import threading
 import time
-from dataclasses import dataclass
-import requests
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 import json
+from collections import deque
 
 from unified_config import config
 from unified_database import db, UnifiedDatabaseManager
@@ -23,7 +23,30 @@ from unified_database import db, UnifiedDatabaseManager
 # Setup logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Coalesce live quote DB writes into one transaction per flush
+QUOTE_FLUSH_SIZE = 50
+QUOTE_FLUSH_INTERVAL = 2.0  # seconds
+QUOTE_BUFFER_MAX_SIZE = 1000  # A full buffer is flushed before it drops anything
+
+@lru_cache(maxsize=512)
+def _resolve_yahoo_symbol(symbol: str) -> str:
+    """Map a platform symbol to its Yahoo ticker (.NS suffix for Indian stocks)"""
+    if not symbol.endswith('.NS') and not config.is_international(symbol):
+        return f"{symbol}.NS"
+    return symbol
+
+def _yahoo_history(symbol: str, **kwargs) -> pd.DataFrame:
+    """Fetch Yahoo history for symbol, falling back to the ticker without .NS"""
+    symbol_ns = _resolve_yahoo_symbol(symbol)
+    data = yf.Ticker(symbol_ns).history(**kwargs)
+    
+    if data.empty and symbol_ns.endswith('.NS'):
+        # Try without .NS suffix
+        data = yf.Ticker(symbol.replace('.NS', '')).history(**kwargs)
+    
+    return data
+
+@dataclass(slots=True, frozen=True)
 class LiveQuote:
     """Live market quote data structure"""
     symbol: str
@@ -36,20 +59,46 @@ class LiveQuote:
     change_percent: float
     timestamp: datetime
     source: str = 'YAHOO'
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'symbol': self.symbol,
-            'price': self.price,
-            'open': self.open_price,
-            'high': self.high,
-            'low': self.low,
-            'volume': self.volume,
-            'change': self.change,
-            'change_percent': self.change_percent,
-            'timestamp': self.timestamp.isoformat(),
-            'source': self.source
-        }
+        """Serialize once per frozen quote; callers get their own copy of the cached dict"""
+        if self._dict_cache is None:
+            object.__setattr__(self, '_dict_cache', {
+                'symbol': self.symbol,
+                'price': self.price,
+                'open': self.open_price,
+                'high': self.high,
+                'low': self.low,
+                'volume': self.volume,
+                'change': self.change,
+                'change_percent': self.change_percent,
+                'timestamp': self.timestamp.isoformat(),
+                'source': self.source
+            })
+        return dict(self._dict_cache)
+
+def _quote_from_history(symbol: str, data: pd.DataFrame, source: str) -> Optional[LiveQuote]:
+    """Build a LiveQuote from an intraday OHLCV frame"""
+    if data.empty:
+        return None
+    
+    # Pull each column out once as a NumPy array
+    price = float(data['Close'].values[-1])
+    open_price = float(data['Open'].values[0])
+    
+    return LiveQuote(
+        symbol=symbol,
+        price=price,
+        open_price=open_price,
+        high=float(data['High'].values.max()),
+        low=float(data['Low'].values.min()),
+        volume=int(data['Volume'].values[-1]),
+        change=price - open_price,
+        change_percent=(price - open_price) / open_price * 100,
+        timestamp=datetime.now(),
+        source=source
+    )
 
 class DataSource:
     """Base class for data sources"""
@@ -90,49 +139,17 @@ class YahooFinanceSource(DataSource):
     
     def __init__(self):
         super().__init__("Yahoo Finance")
-        self.session = requests.Session()
     
     async def get_quote(self, symbol: str) -> Optional[LiveQuote]:
         """Get live quote from Yahoo Finance"""
         try:
-            # Try Indian stock first (.NS suffix)
-            if not symbol.endswith('.NS') and symbol not in config.INTERNATIONAL_SYMBOLS:
-                symbol_ns = f"{symbol}.NS"
-            else:
-                symbol_ns = symbol
-            
-            # Let yfinance handle the session
-            ticker = yf.Ticker(symbol_ns)
+            # Get intraday data (Indian stocks via .NS suffix) off the event loop
+            data = await asyncio.to_thread(_yahoo_history, symbol, period="1d", interval="1m")
             
-            # Get intraday data
-            data = ticker.history(period="1d", interval="1m")
-            
-            if data.empty and symbol_ns.endswith('.NS'):
-                # Try without .NS suffix
-                ticker = yf.Ticker(symbol.replace('.NS', ''))
-                data = ticker.history(period="1d", interval="1m")
-            
-            if not data.empty:
-                latest = data.iloc[-1]
-                open_price = data.iloc[0]['Open']
-                
-                quote = LiveQuote(
-                    symbol=symbol,
-                    price=float(latest['Close']),
-                    open_price=float(open_price),
-                    high=float(data['High'].max()),
-                    low=float(data['Low'].min()),
-                    volume=int(latest['Volume']),
-                    change=float(latest['Close'] - open_price),
-                    change_percent=float((latest['Close'] - open_price) / open_price * 100),
-                    timestamp=datetime.now(),
-                    source=self.name
-                )
-                
+            quote = _quote_from_history(symbol, data, self.name)
+            if quote:
                 self.error_count = 0  # Reset error count on success
-                return quote
-            
-            return None
+            return quote
             
         except Exception as e:
             self.handle_error(e)
@@ -145,15 +162,17 @@ class UnifiedLiveDataManager:
     def __init__(self, database: UnifiedDatabaseManager = None):
         self.db = database or db
         self.data_sources = []
-        self.subscribers = []
+        self.subscribers: Dict[Callable[[str, LiveQuote], None], str] = {}
         self.running = False
         self.watchlist = config.get_active_symbols()
         self.update_interval = config.LIVE_DATA_UPDATE_INTERVAL
         self.quote_cache = {}
         self.last_update = {}
+        self._write_buffer: Deque[Tuple[str, Dict[str, Any]]] = deque(maxlen=QUOTE_BUFFER_MAX_SIZE)
+        self._write_lock = threading.Lock()
+        self._last_flush = time.monotonic()
         
         self._setup_data_sources()
-        self._executor = ThreadPoolExecutor(max_workers=5)
         
         logger.info(f"Live data manager initialized with {len(self.watchlist)} symbols")
     
@@ -165,22 +184,26 @@ class UnifiedLiveDataManager:
     
     def add_subscriber(self, callback: Callable[[str, LiveQuote], None]):
         """Add callback for live data updates"""
-        self.subscribers.append(callback)
-        logger.info(f"Added data subscriber: {callback.__name__}")
+        name = callback.__name__
+        self.subscribers[callback] = name
+        logger.info(f"Added data subscriber: {name}")
     
     def remove_subscriber(self, callback: Callable):
         """Remove data update callback"""
-        if callback in self.subscribers:
-            self.subscribers.remove(callback)
-            logger.info(f"Removed data subscriber: {callback.__name__}")
+        name = self.subscribers.pop(callback, None)
+        if name is not None:
+            logger.info(f"Removed data subscriber: {name}")
     
     def notify_subscribers(self, symbol: str, quote: LiveQuote):
         """Notify all subscribers of data update"""
-        for callback in self.subscribers:
+        if not self.subscribers:
+            return
+        
+        for callback, name in list(self.subscribers.items()):
             try:
                 callback(symbol, quote)
             except Exception as e:
-                logger.error(f"Error notifying subscriber {callback.__name__}: {e}")
+                logger.error(f"Error notifying subscriber {name}: {e}")
     
     async def get_live_quote(self, symbol: str) -> Optional[LiveQuote]:
         """Get live quote using best available data source"""
@@ -191,13 +214,7 @@ class UnifiedLiveDataManager:
             try:
                 quote = await source.get_quote(symbol)
                 if quote:
-                    # Cache the quote
-                    self.quote_cache[symbol] = quote
-                    self.last_update[symbol] = datetime.now()
-                    
-                    # Store in database
-                    self.db.store_live_quote(symbol, quote.to_dict())
-                    
+                    self._cache_quote(symbol, quote)
                     return quote
             except Exception as e:
                 logger.error(f"Error getting quote for {symbol} from {source.name}: {e}")
@@ -212,24 +229,90 @@ class UnifiedLiveDataManager:
         
         return None
     
+    def _cache_quote(self, symbol: str, quote: LiveQuote):
+        """Cache a fresh quote and store it in the database"""
+        self.quote_cache[symbol] = quote
+        self.last_update[symbol] = datetime.now()
+        
+        # Buffer for the next bulk database write; drain a full buffer instead of dropping quotes
+        with self._write_lock:
+            full = len(self._write_buffer) >= QUOTE_BUFFER_MAX_SIZE
+        if full:
+            self.flush_quote_buffer(force=True)
+        
+        with self._write_lock:
+            if len(self._write_buffer) >= QUOTE_BUFFER_MAX_SIZE:
+                logger.warning("Quote write buffer full, dropping oldest buffered quote for %s",
+                               self._write_buffer[0][0])
+            self._write_buffer.append((symbol, quote.to_dict()))
+        
+        # Flush here too so callers outside the feed loop still reach the database
+        self.flush_quote_buffer()
+    
+    def flush_quote_buffer(self, force: bool = False):
+        """Write buffered quotes to the database once the batch is due"""
+        with self._write_lock:
+            due = (len(self._write_buffer) >= QUOTE_FLUSH_SIZE or
+                   time.monotonic() - self._last_flush >= QUOTE_FLUSH_INTERVAL)
+            if not self._write_buffer or not (force or due):
+                return
+            buffer = list(self._write_buffer)
+            self._write_buffer.clear()
+            self._last_flush = time.monotonic()
+        
+        self.db.store_live_quotes_bulk(buffer)
+    
+    def _batch_fetch(self, symbols: List[str], source: DataSource) -> Dict[str, LiveQuote]:
+        """Fetch intraday quotes for many symbols in a single Yahoo request"""
+        tickers = {_resolve_yahoo_symbol(symbol): symbol for symbol in symbols}
+        
+        frame = yf.download(tickers=" ".join(tickers), period="1d", interval="1m",
+                            group_by='ticker', threads=True, progress=False)
+        
+        quotes = {}
+        if frame is None or frame.empty:
+            return quotes
+        
+        grouped = isinstance(frame.columns, pd.MultiIndex)
+        if not grouped and len(tickers) > 1:
+            return quotes
+        
+        batch_tickers = set(frame.columns.get_level_values(0)) if grouped else set(tickers)
+        for ticker, symbol in tickers.items():
+            if ticker not in batch_tickers:
+                continue
+            
+            data = frame[ticker] if grouped else frame
+            quote = _quote_from_history(symbol, data.dropna(subset=['Close']), source.name)
+            if quote:
+                quotes[symbol] = quote
+        
+        return quotes
+    
     async def get_multiple_quotes(self, symbols: List[str]) -> Dict[str, LiveQuote]:
         """Get quotes for multiple symbols efficiently"""
         quotes = {}
         
-        # Use ThreadPoolExecutor for parallel requests
-        tasks = []
-        for symbol in symbols:
-            task = asyncio.create_task(self.get_live_quote(symbol))
-            tasks.append((symbol, task))
-        
-        # Wait for all tasks to complete
-        for symbol, task in tasks:
+        # One batched Yahoo request for the whole list
+        yahoo = next((source for source in self.data_sources
+                      if isinstance(source, YahooFinanceSource) and source.is_active), None)
+        if yahoo and symbols:
             try:
-                quote = await task
-                if quote:
-                    quotes[symbol] = quote
+                quotes = await asyncio.to_thread(self._batch_fetch, symbols, yahoo)
+                for symbol, quote in quotes.items():
+                    self._cache_quote(symbol, quote)
             except Exception as e:
-                logger.error(f"Error getting quote for {symbol}: {e}")
+                logger.error(f"Error in batch quote fetch: {e}")
+        
+        # Fall back to concurrent per-symbol requests for anything missing from the batch
+        missing = [symbol for symbol in symbols if symbol not in quotes]
+        results = await asyncio.gather(*(self.get_live_quote(symbol) for symbol in missing),
+                                       return_exceptions=True)
+        for symbol, quote in zip(missing, results):
+            if isinstance(quote, Exception):
+                logger.error(f"Error getting quote for {symbol}: {quote}")
+            elif quote:
+                quotes[symbol] = quote
         
         return quotes
     
@@ -238,6 +321,7 @@ class UnifiedLiveDataManager:
         try:
             start_time = time.time()
             quotes = await self.get_multiple_quotes(self.watchlist)
+            self.flush_quote_buffer()
             
             # Notify subscribers
             for symbol, quote in quotes.items():
@@ -274,6 +358,7 @@ class UnifiedLiveDataManager:
             logger.error(f"Error in live feed: {e}")
         finally:
             self.running = False
+            self.flush_quote_buffer(force=True)
             logger.info("Live data feed stopped")
     
     def stop_live_feed(self):
@@ -305,32 +390,21 @@ class UnifiedLiveDataManager:
         """Add symbol to watchlist"""
         if symbol not in self.watchlist:
             self.watchlist.append(symbol)
+            config.refresh_symbol_cache()
             logger.info(f"Added {symbol} to watchlist")
     
     def remove_symbol_from_watchlist(self, symbol: str):
         """Remove symbol from watchlist"""
         if symbol in self.watchlist:
             self.watchlist.remove(symbol)
+            config.refresh_symbol_cache()
             logger.info(f"Removed {symbol} from watchlist")
     
     def get_historical_data(self, symbol: str, period: str = "1y") -> pd.DataFrame:
         """Get historical data for technical analysis"""
         try:
             # Try with .NS suffix for Indian stocks
-            if not symbol.endswith('.NS') and symbol not in config.INTERNATIONAL_SYMBOLS:
-                symbol_ns = f"{symbol}.NS"
-            else:
-                symbol_ns = symbol
-            
-            ticker = yf.Ticker(symbol_ns)
-            data = ticker.history(period=period)
-            
-            if data.empty and symbol_ns.endswith('.NS'):
-                # Try without .NS suffix
-                ticker = yf.Ticker(symbol.replace('.NS', ''))
-                data = ticker.history(period=period)
-            
-            return data
+            return _yahoo_history(symbol, period=period)
             
         except Exception as e:
             logger.error(f"Error getting historical data for {symbol}: {e}")
@@ -8,6 +8,7 @@ import asyncio
 import json
 import logging
 import requests
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
@@ -26,11 +27,22 @@ class TelegramNotifier:
         self.chat_id = chat_id
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
         self.enabled = bool(bot_token and chat_id)
+        # Keep-alive sessions, one per thread: messages are sent from worker threads
+        # concurrently and requests.Session is not thread-safe
+        self._local = threading.local()
         if self.enabled:
             logger.info("✅ Telegram notifier initialized")
         else:
             logger.warning("⚠️ Telegram notifier disabled - missing credentials")
 
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session owned by the calling thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
     def send_message(self, message: str, parse_mode: str = "HTML") -> bool:
         if not self.enabled:
             logger.debug("Telegram disabled, skipping message")
@@ -38,7 +50,7 @@ class TelegramNotifier:
         try:
             url = f"{self.base_url}/sendMessage"
             data = { 'chat_id': self.chat_id, 'text': message, 'parse_mode': parse_mode }
-            resp = requests.post(url, data=data, timeout=10)
+            resp = self.session.post(url, data=data, timeout=10)
             if resp.status_code == 200:
                 return True
             logger.error(f"❌ Telegram API error: {resp.status_code}")
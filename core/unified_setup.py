@@ -29,8 +29,8 @@ def check_python_version():
     """Check Python version"""
     print("🐍 Checking Python version...")
     
-    if sys.version_info < (3, 8):
-        print("❌ Python 3.8 or higher is required!")
+    if sys.version_info < (3, 10):
+        print("❌ Python 3.10 or higher is required!")
         print(f"   Current version: {sys.version}")
         return False
     
@@ -283,13 +283,6 @@ def test_installation():
             print("   ❌ yfinance import failed - market data will not work")
             return False
         
-        # Test schedule
-        try:
-            import schedule
-            print("   ✅ schedule (task scheduling)")
-        except ImportError:
-            print("   ⚠️  schedule import failed - automated tasks disabled")
-        
         # Test technical analysis
         try:
             import ta
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import logging
 import asyncio
+import threading
 import json
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -23,6 +24,9 @@ from unified_ai_signals import ai_signal_generator, AISignal
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# How long a caller on another thread waits for an order to complete
+ORDER_TIMEOUT_SECONDS = 30
+
 class OrderType(Enum):
     MARKET = "MARKET"
     LIMIT = "LIMIT"
@@ -40,6 +44,9 @@ class PositionType(Enum):
     LONG = "LONG"
     SHORT = "SHORT"
 
+# P&L sign per position side: LONG gains as price rises, SHORT as it falls
+POSITION_SIGNS = {PositionType.LONG: 1, PositionType.SHORT: -1}
+
 @dataclass
 class Order:
     """Trading order"""
@@ -272,6 +279,13 @@ class UnifiedTradingManager:
         self.positions: Dict[str, Position] = {}
         self.trades: List[Trade] = []
         
+        # Order placement runs on a single event loop: the platform's scheduler
+        # loop when it is running, otherwise a private background loop
+        self._order_lock = asyncio.Lock()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._own_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._own_loop_lock = threading.Lock()
+        
         # Performance tracking
         self.daily_pnl = 0.0
         self.total_pnl = 0.0
@@ -337,10 +351,8 @@ class UnifiedTradingManager:
                     position.last_update = datetime.now()
                     
                     # Calculate unrealized P&L
-                    if position.position_type == PositionType.LONG:
-                        position.unrealized_pnl = (quote.price - position.avg_price) * position.quantity
-                    else:
-                        position.unrealized_pnl = (position.avg_price - quote.price) * position.quantity
+                    position.unrealized_pnl = (POSITION_SIGNS[position.position_type] *
+                                               (quote.price - position.avg_price) * position.quantity)
                     
                     unrealized_pnl += position.unrealized_pnl
                     total_value += position.quantity * quote.price
@@ -367,11 +379,33 @@ class UnifiedTradingManager:
         except Exception as e:
             logger.error(f"Error updating portfolio value: {e}")
     
+    def run_threadsafe(self, coro, timeout: float = ORDER_TIMEOUT_SECONDS):
+        """Run an order coroutine on the order loop from another thread"""
+        loop = self.loop if self.loop is not None and self.loop.is_running() else self._get_own_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+    
+    def _get_own_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the private order loop on first use"""
+        with self._own_loop_lock:
+            if self._own_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='order-loop', daemon=True).start()
+                self._own_loop = loop
+            return self._own_loop
+    
     async def place_order(self, symbol: str, side: str, quantity: int,
                          order_type: OrderType = OrderType.MARKET,
                          price: Optional[float] = None,
                          stop_price: Optional[float] = None) -> Optional[Order]:
         """Place a trading order"""
+        async with self._order_lock:
+            return await self._place_order(symbol, side, quantity, order_type, price, stop_price)
+    
+    async def _place_order(self, symbol: str, side: str, quantity: int,
+                          order_type: OrderType = OrderType.MARKET,
+                          price: Optional[float] = None,
+                          stop_price: Optional[float] = None) -> Optional[Order]:
+        """Place a trading order; caller must hold the order lock"""
         try:
             # For market orders, get current market price
             if order_type == OrderType.MARKET and price is None:
@@ -568,10 +602,7 @@ class UnifiedTradingManager:
     async def _record_trade(self, position: Position, exit_price: float):
         """Record completed trade"""
         try:
-            if position.position_type == PositionType.LONG:
-                pnl = (exit_price - position.avg_price) * position.quantity
-            else:
-                pnl = (position.avg_price - exit_price) * position.quantity
+            pnl = POSITION_SIGNS[position.position_type] * (exit_price - position.avg_price) * position.quantity
             
             trade = Trade(
                 symbol=position.symbol,
@@ -623,56 +654,59 @@ class UnifiedTradingManager:
                            f"with {signal.confidence:.1f}% confidence")
                 return False
             
-            # Check if we already have a position in this symbol
-            if signal.symbol in self.positions:
-                logger.debug(f"Already have position in {signal.symbol}, skipping signal")
-                return False
-            
-            # Get current quote
-            quote = await live_data_manager.get_live_quote(signal.symbol)
-            if not quote:
-                logger.warning(f"No quote available for {signal.symbol}")
-                return False
-            
-            # Calculate position size
-            quantity = self.risk_manager.calculate_position_size(
-                self.paper_engine.portfolio_value,
-                quote.price,
-                signal.stop_loss,
-                signal.confidence
-            )
-            
-            if quantity <= 0:
-                logger.warning(f"Invalid position size for {signal.symbol}")
-                return False
-            
-            # Place order
-            side = 'BUY' if signal.signal_type == 'BUY' else 'SELL'
-            order = await self.place_order(
-                symbol=signal.symbol,
-                side=side,
-                quantity=quantity,
-                order_type=OrderType.MARKET
-            )
-            
-            if order:
-                logger.info(f"Placed order based on AI signal: {side} {quantity} {signal.symbol}")
+            # Hold the order lock from the position check through sizing and
+            # placement so concurrent signals see each other's positions and cash
+            async with self._order_lock:
+                # Check if we already have a position in this symbol
+                if signal.symbol in self.positions:
+                    logger.debug(f"Already have position in {signal.symbol}, skipping signal")
+                    return False
                 
-                # Place stop loss order if provided
-                if signal.stop_loss and order.status == OrderStatus.FILLED:
-                    stop_side = 'SELL' if side == 'BUY' else 'BUY'
-                    await self.place_order(
-                        symbol=signal.symbol,
-                        side=stop_side,
-                        quantity=quantity,
-                        order_type=OrderType.STOP_LOSS,
-                        stop_price=signal.stop_loss
-                    )
-                    logger.info(f"Placed stop loss order at ₹{signal.stop_loss:.2f}")
+                # Get current quote
+                quote = await live_data_manager.get_live_quote(signal.symbol)
+                if not quote:
+                    logger.warning(f"No quote available for {signal.symbol}")
+                    return False
                 
-                return True
-            
-            return False
+                # Calculate position size
+                quantity = self.risk_manager.calculate_position_size(
+                    self.paper_engine.portfolio_value,
+                    quote.price,
+                    signal.stop_loss,
+                    signal.confidence
+                )
+                
+                if quantity <= 0:
+                    logger.warning(f"Invalid position size for {signal.symbol}")
+                    return False
+                
+                # Place order
+                side = 'BUY' if signal.signal_type == 'BUY' else 'SELL'
+                order = await self._place_order(
+                    symbol=signal.symbol,
+                    side=side,
+                    quantity=quantity,
+                    order_type=OrderType.MARKET
+                )
+                
+                if order:
+                    logger.info(f"Placed order based on AI signal: {side} {quantity} {signal.symbol}")
+                    
+                    # Place stop loss order if provided
+                    if signal.stop_loss and order.status == OrderStatus.FILLED:
+                        stop_side = 'SELL' if side == 'BUY' else 'BUY'
+                        await self._place_order(
+                            symbol=signal.symbol,
+                            side=stop_side,
+                            quantity=quantity,
+                            order_type=OrderType.STOP_LOSS,
+                            stop_price=signal.stop_loss
+                        )
+                        logger.info(f"Placed stop loss order at ₹{signal.stop_loss:.2f}")
+                    
+                    return True
+                
+                return False
             
         except Exception as e:
             logger.error(f"Error processing AI signal: {e}")
@@ -730,7 +764,8 @@ class UnifiedTradingManager:
         try:
             for order_id, order in list(self.active_orders.items()):
                 if order.status == OrderStatus.PENDING:
-                    await self._process_order(order)
+                    async with self._order_lock:
+                        await self._process_order(order)
                     
         except Exception as e:
             logger.error(f"Error processing pending orders: {e}")
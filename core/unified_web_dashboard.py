@@ -10,7 +10,7 @@ import json
 import asyncio
 from datetime import datetime, timedelta
 import pandas as pd
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import logging
 import threading
 import time
@@ -36,6 +36,18 @@ BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 WEB_STATIC_DIR = os.path.join(BASE_DIR, 'web', 'static')
 WEB_TEMPLATES_DIR = os.path.join(BASE_DIR, 'web', 'templates')
 
+def _isoformat_column(df: pd.DataFrame, column: str) -> List[Optional[str]]:
+    """Parse a timestamp column in one pass and return ISO strings per row"""
+    if column not in df:
+        # Keep one entry per row so callers zipping with iterrows() don't drop rows
+        return [None] * len(df)
+    try:
+        timestamps = pd.to_datetime(df[column])
+    except ValueError:
+        # Mixed string formats, fall back to parsing each value
+        timestamps = [pd.to_datetime(value) for value in df[column]]
+    return [timestamp.isoformat() for timestamp in timestamps]
+
 class DashboardManager:
     """Manages dashboard data and real-time updates"""
     
@@ -191,7 +203,8 @@ class DashboardManager:
             orders_df = db.get_orders(limit=50)
             orders = []
             if isinstance(orders_df, pd.DataFrame) and not orders_df.empty:
-                for _, row in orders_df.iterrows():
+                order_times = _isoformat_column(orders_df, 'timestamp')
+                for (_, row), timestamp in zip(orders_df.iterrows(), order_times):
                     orders.append({
                         'order_id': row['order_id'],
                         'symbol': row['symbol'],
@@ -199,14 +212,16 @@ class DashboardManager:
                         'quantity': row['quantity'],
                         'price': row['price'],
                         'status': row['status'],
-                        'timestamp': pd.to_datetime(row['timestamp']).isoformat()
+                        'timestamp': timestamp
                     })
             
             # Get recent trades
             trades_df = db.get_trades(limit=20)
             trades = []
             if isinstance(trades_df, pd.DataFrame) and not trades_df.empty:
-                for _, row in trades_df.iterrows():
+                entry_times = _isoformat_column(trades_df, 'entry_time')
+                exit_times = _isoformat_column(trades_df, 'exit_time')
+                for (_, row), entry_time, exit_time in zip(trades_df.iterrows(), entry_times, exit_times):
                     trades.append({
                         'trade_id': row['trade_id'],
                         'symbol': row['symbol'],
@@ -215,8 +230,8 @@ class DashboardManager:
                         'exit_price': row['exit_price'],
                         'quantity': row['quantity'],
                         'pnl': row['pnl'],
-                        'entry_time': pd.to_datetime(row['entry_time']).isoformat(),
-                        'exit_time': pd.to_datetime(row['exit_time']).isoformat()
+                        'entry_time': entry_time,
+                        'exit_time': exit_time
                     })
             
             # Emit to all connected clients
@@ -374,7 +389,8 @@ def api_orders():
         # Get orders
         orders_df = db.get_orders(limit=100)
         orders = []
-        for _, row in orders_df.iterrows():
+        order_times = _isoformat_column(orders_df, 'timestamp')
+        for (_, row), timestamp in zip(orders_df.iterrows(), order_times):
             orders.append({
                 'order_id': row['order_id'],
                 'symbol': row['symbol'],
@@ -382,13 +398,15 @@ def api_orders():
                 'quantity': row['quantity'],
                 'price': row['price'],
                 'status': row['status'],
-                'timestamp': pd.to_datetime(row['timestamp']).isoformat()
+                'timestamp': timestamp
             })
         
         # Get trades
         trades_df = db.get_trades(limit=50)
         trades = []
-        for _, row in trades_df.iterrows():
+        entry_times = _isoformat_column(trades_df, 'entry_time')
+        exit_times = _isoformat_column(trades_df, 'exit_time')
+        for (_, row), entry_time, exit_time in zip(trades_df.iterrows(), entry_times, exit_times):
             trades.append({
                 'trade_id': row['trade_id'],
                 'symbol': row['symbol'],
@@ -397,8 +415,8 @@ def api_orders():
                 'exit_price': row['exit_price'],
                 'quantity': row['quantity'],
                 'pnl': row['pnl'],
-                'entry_time': pd.to_datetime(row['entry_time']).isoformat(),
-                'exit_time': pd.to_datetime(row['exit_time']).isoformat()
+                'entry_time': entry_time,
+                'exit_time': exit_time
             })
         
         return jsonify({'orders': orders, 'trades': trades})
@@ -412,18 +430,14 @@ def api_place_order():
     try:
         data = request.json
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        order = loop.run_until_complete(trading_manager.place_order(
+        # Orders run on the trading manager's loop so they share its order lock
+        order = trading_manager.run_threadsafe(trading_manager.place_order(
             symbol=data['symbol'],
             side=data['side'],
             quantity=int(data['quantity']),
             order_type=OrderType.MARKET
         ))
         
-        loop.close()
-        
         if order:
             return jsonify({
                 'success': True,
@@ -621,12 +635,8 @@ def on_place_order(data):
             emit('error', {'message': 'Missing required order parameters'})
             return
         
-        # Place order through trading manager
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        # Use the correct method name and parameters
-        result = loop.run_until_complete(
+        # Place order through trading manager on its order loop
+        result = trading_manager.run_threadsafe(
             trading_manager.place_order(
                 symbol=symbol,
                 side=order_type.upper(),  # 'BUY' or 'SELL'
@@ -635,8 +645,6 @@ def on_place_order(data):
             )
         )
         
-        loop.close()
-        
         if result is not None:
             # result is an Order object
             emit('order_placed', {
@@ -75,20 +75,23 @@ def SUPERTREND(high, low, close, period=10, multiplier=3):
         upper_band = hl2 + (multiplier * atr)
         lower_band = hl2 - (multiplier * atr)
         
-        supertrend = pd.Series(index=close.index, dtype=float)
-        direction = pd.Series(index=close.index, dtype=float)
+        # Walk plain ndarrays; only the band choice depends on the previous bar
+        close_values = np.asarray(close, dtype=float)
+        lower_values = np.asarray(lower_band, dtype=float)
+        upper_values = np.asarray(upper_band, dtype=float)
+        supertrend_values = np.empty(len(close_values))
+        direction_values = np.empty(len(close_values))
         
-        for i in range(len(close)):
-            if i == 0:
-                supertrend.iloc[i] = lower_band.iloc[i]
-                direction.iloc[i] = 1
+        for i in range(len(close_values)):
+            if i == 0 or close_values[i] > supertrend_values[i-1]:
+                supertrend_values[i] = lower_values[i]
+                direction_values[i] = 1
             else:
-                if close.iloc[i] > supertrend.iloc[i-1]:
-                    supertrend.iloc[i] = lower_band.iloc[i]
-                    direction.iloc[i] = 1
-                else:
-                    supertrend.iloc[i] = upper_band.iloc[i]
-                    direction.iloc[i] = -1
+                supertrend_values[i] = upper_values[i]
+                direction_values[i] = -1
+        
+        supertrend = pd.Series(supertrend_values, index=close.index)
+        direction = pd.Series(direction_values, index=close.index)
         
         return supertrend, direction
     except Exception as e:
@@ -142,8 +145,16 @@ def WILLIAMS_R(high, low, close, period=14):
 def OBV(close, volume):
     """On Balance Volume"""
     try:
-        obv = (volume * np.sign(close.diff())).cumsum()
-        return obv
+        # Direction as int8 {-1, 0, 1}; NaN deltas compare False and are masked below
+        delta = np.asarray(close.diff(), dtype=float)
+        direction = (delta > 0).astype(np.int8) - (delta < 0).astype(np.int8)
+        flow = np.asarray(volume, dtype=float) * direction
+        
+        # Cumulative sum that skips missing bars like Series.cumsum()
+        missing = np.isnan(flow) | np.isnan(delta)
+        obv = np.cumsum(np.where(missing, 0.0, flow))
+        obv[missing] = np.nan
+        return pd.Series(obv, index=close.index)
     except Exception as e:
         print(f"Error calculating OBV: {e}")
         return pd.Series(index=close.index, dtype=float)
@@ -151,7 +162,8 @@ def OBV(close, volume):
 def ROC(prices, period=10):
     """Rate of Change"""
     try:
-        roc = ((prices - prices.shift(period)) / prices.shift(period)) * 100
+        previous = prices.shift(period)
+        roc = ((prices - previous) / previous) * 100
         return roc
     except Exception as e:
         print(f"Error calculating ROC: {e}")
@@ -189,3 +201,27 @@ def lowest(series, period):
     except Exception as e:
         print(f"Error calculating lowest: {e}")
         return pd.Series(index=series.index, dtype=float)
+
+if __name__ == "__main__":
+    print("Checking ta_indicators against the pandas reference formulas")
+    close = pd.Series([100.0, 101.5, 101.5, np.nan, 99.0, 100.2, 98.7, 102.3])
+    volume = pd.Series([1200.0, 900.0, 1500.0, 1100.0, 1300.0, 800.0, 1700.0, 1000.0])
+    
+    # OBV: NaN in close.diff() (first bar and around the gap) must match Series.cumsum()
+    expected = (volume * np.sign(close.diff())).cumsum()
+    for label, vol in (("Series volume", volume), ("ndarray volume", volume.to_numpy())):
+        result = OBV(close, vol)
+        assert isinstance(result, pd.Series) and result.index.equals(close.index), label
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), equal_nan=True, err_msg=label)
+        print(f"  OBV ({label}): OK")
+    
+    # SUPERTREND: ndarray walk must match the per-element iloc reference
+    high = close + 1.0
+    low = close - 1.0
+    supertrend, direction = SUPERTREND(high, low, close, period=3)
+    hl2 = (high + low) / 2
+    atr = (high - low).rolling(window=3).mean()
+    for i in range(len(close)):
+        band = hl2 - 3 * atr if i == 0 or close.iloc[i] > supertrend.iloc[i-1] else hl2 + 3 * atr
+        np.testing.assert_allclose(supertrend.iloc[i], band.iloc[i], equal_nan=True)
+    print("  SUPERTREND: OK")